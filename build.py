@@ -7,6 +7,8 @@ Builds a portable executable using PyInstaller with comprehensive error handling
 import os
 import sys
 import subprocess
+import compileall
+import importlib.util
 import shutil
 from pathlib import Path
 from datetime import datetime
@@ -29,22 +31,32 @@ def check_dependencies():
     """Check if required dependencies are available."""
     print("Checking dependencies...")
     
-    try:
-        import PyQt6
-        print("PyQt6 available")
-    except ImportError:
+    # find_spec locates the packages without executing their imports
+    if importlib.util.find_spec("PyQt6") is None:
         print("PyQt6 not found. Install with: pip install PyQt6")
         return False
+    print("PyQt6 available")
     
-    try:
-        import PyInstaller
-        print("PyInstaller available")
-    except ImportError:
+    if importlib.util.find_spec("PyInstaller") is None:
         print("PyInstaller not found. Install with: pip install pyinstaller")
         return False
+    print("PyInstaller available")
     
     return True
 
+def compile_sources():
+    """Byte-compile the sources so syntax errors fail fast and imports skip parsing."""
+    print("Compiling sources...")
+    
+    # Compile in-process rather than spawning a second interpreter;
+    # workers=0 spreads the modules across all CPU cores
+    if compileall.compile_dir("src", quiet=1, workers=0):
+        print("Sources compiled")
+        return True
+    
+    print("Compilation failed")
+    return False
+
 def build_executable():
     """Build the FieldTuner 2.0 executable."""
     print("Building FieldTuner 2.0 executable...")
@@ -113,6 +125,10 @@ def main():
     # Clean previous builds
     clean_build_directories()
     
+    # Compile sources
+    if not compile_sources():
+        return False
+    
     # Build executable
     if not build_executable():
         print("Build failed")
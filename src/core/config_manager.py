@@ -5,7 +5,10 @@ Handles all Battlefield 6 configuration file operations with bulletproof parsing
 
 import os
 import re
+import json
+import time
 import struct
+import hashlib
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
@@ -18,6 +21,9 @@ from core.path_config import path_config
 class ConfigManager:
     """BULLETPROOF config manager with comprehensive error handling and multiple parsing methods."""
     
+    # Seconds a Battlefield process scan result is reused before scanning again
+    PROCESS_CHECK_TTL = 2.0
+    
     def __init__(self, config_path: Optional[Union[str, Path]] = None):
         """Initialize the config manager with bulletproof error handling."""
         log_info("Initializing BULLETPROOF ConfigManager", "CONFIG")
@@ -32,6 +38,9 @@ class ConfigManager:
         self._cache_valid = False
         self.settings: Dict[str, str] = {}
         
+        # Last Battlefield process scan as (monotonic time, result)
+        self._process_check: Optional[tuple] = None
+        
         # Comprehensive Battlefield 6 config paths for all installation types
         self.CONFIG_PATHS = self._get_all_config_paths()
         
@@ -315,6 +324,14 @@ class ConfigManager:
     def _detect_config_file(self) -> bool:
         """Auto-detect the Battlefield 6 config file with comprehensive path checking."""
         log_info("Detecting Battlefield 6 config file", "CONFIG")
+        
+        # Try the location found on a previous launch before probing every candidate
+        cached_path = path_config.get_cached_config_path()
+        if cached_path and self._validate_config_file(cached_path):
+            self.config_path = cached_path
+            log_info(f"Using previously detected config file: {cached_path}", "CONFIG")
+            return True
+        
         log_info(f"Checking {len(self.CONFIG_PATHS)} possible config locations", "CONFIG")
         
         for i, path in enumerate(self.CONFIG_PATHS):
@@ -322,6 +339,7 @@ class ConfigManager:
             if path.exists():
                 if self._validate_config_file(path):
                     self.config_path = path
+                    path_config.remember_config_path(path)
                     log_info(f"Valid Battlefield 6 config file found: {path}", "CONFIG")
                     return True
                 else:
@@ -377,7 +395,17 @@ class ConfigManager:
             return False
     
     def _is_battlefield_running(self) -> bool:
-        """Check if Battlefield 6 is currently running."""
+        """Check if Battlefield 6 is currently running, reusing a recent scan."""
+        now = time.monotonic()
+        if self._process_check and now - self._process_check[0] < self.PROCESS_CHECK_TTL:
+            return self._process_check[1]
+        
+        running = self._scan_for_battlefield()
+        self._process_check = (now, running)
+        return running
+    
+    def _scan_for_battlefield(self) -> bool:
+        """Scan the process table for a running Battlefield 6."""
         try:
             import psutil
             
@@ -477,6 +505,11 @@ class ConfigManager:
         
             log_info(f"BULLETPROOF: Loading config from: {self.config_path}", "CONFIG")
         
+        # Reuse the previous parse if the file is unchanged since it was cached
+        if self._load_parse_cache():
+            log_info(f"Loaded {len(self.config_data)} settings from parse cache", "CONFIG")
+            return True
+        
         # Try multiple loading methods in order of preference
         loading_methods = [
             ("Binary Parser", self._load_binary_config),
@@ -491,6 +524,7 @@ class ConfigManager:
                 result = method_func()
                 if result and len(self.config_data) > 0:
                     log_info(f"SUCCESS: {method_name} loaded {len(self.config_data)} settings", "CONFIG")
+                    self._save_parse_cache()
                     return True
                 else:
                     log_warning(f"{method_name} returned empty results", "CONFIG")
@@ -506,6 +540,55 @@ class ConfigManager:
         self._validate_loaded_config()
         return True
     
+    def _parse_cache_file(self) -> Path:
+        """Get the parse cache file for the current config path."""
+        key = str(self.config_path.resolve())
+        return path_config.cache_dir / f"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}.json"
+    
+    def _config_signature(self) -> Optional[List[int]]:
+        """Get the (mtime, size) pair that invalidates the parse cache when the file changes."""
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+    
+    def _load_parse_cache(self) -> bool:
+        """Load config_data from the parse cache if the config file has not changed."""
+        cache_file = self._parse_cache_file()
+        signature = self._config_signature()
+        if signature is None or not cache_file.exists():
+            return False
+        
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('signature') != signature:
+                return False
+            # The raw bytes are still needed to write the file back out
+            with open(self.config_path, 'rb') as f:
+                self.original_data = f.read()
+        except (OSError, ValueError, AttributeError) as e:
+            log_debug(f"Parse cache unusable: {e}", "CONFIG")
+            return False
+        
+        self.config_data = cached.get('config_data', {})
+        return len(self.config_data) > 0
+    
+    def _save_parse_cache(self):
+        """Store the parsed config_data so an unchanged file can skip parsing next time."""
+        signature = self._config_signature()
+        if signature is None:
+            return
+        
+        try:
+            cache_file = self._parse_cache_file()
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'signature': signature, 'config_data': self.config_data}, f)
+        except OSError as e:
+            log_debug(f"Failed to write parse cache: {e}", "CONFIG")
+    
     def _load_binary_config(self) -> bool:
         """Load config using binary parser (primary method)."""
         try:
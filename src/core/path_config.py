@@ -6,12 +6,19 @@ making it easy to update paths and follow best practices for cross-platform comp
 """
 
 import os
+import json
+from functools import cached_property
 from pathlib import Path
 from typing import List, Optional
 
 
 class PathConfig:
-    """Centralized path configuration for FieldTuner 2.0."""
+    """
+    Centralized path configuration for FieldTuner 2.0.
+    
+    Paths are derived on first access and memoized on the instance, so
+    importing the module or constructing the singleton touches nothing.
+    """
     
     def __init__(self):
         """Initialize path configuration."""
@@ -19,37 +26,47 @@ class PathConfig:
         self._bf6_folder_name = "Battlefield 6"
         self._config_filename = "PROFSAVE_profile"
         
-    @property
+    @cached_property
     def app_data_dir(self) -> Path:
         """Get the application data directory."""
         return Path.home() / "AppData" / "Roaming" / self._app_name
     
-    @property
+    @cached_property
     def logs_dir(self) -> Path:
         """Get the logs directory."""
         return self.app_data_dir / "logs"
     
-    @property
+    @cached_property
     def backups_dir(self) -> Path:
         """Get the backups directory."""
         return self.app_data_dir / "backups"
     
-    @property
+    @cached_property
+    def cache_dir(self) -> Path:
+        """Get the cache directory."""
+        return self.app_data_dir / "cache"
+    
+    @cached_property
     def favorites_file(self) -> Path:
         """Get the favorites file path."""
         return self.app_data_dir / "favorites.json"
     
-    @property
+    @cached_property
     def preferences_file(self) -> Path:
         """Get the preferences file path."""
         return self.app_data_dir / "preferences.json"
     
-    @property
+    @cached_property
     def app_state_file(self) -> Path:
         """Get the app state file path."""
         return self.app_data_dir / "app_state.json"
     
-    @property
+    @cached_property
+    def resolved_paths_file(self) -> Path:
+        """Get the file remembering the last detected config location."""
+        return self.app_data_dir / "resolved_paths.json"
+    
+    @cached_property
     def test_config_file(self) -> Path:
         """Get the test config file path (for development/testing)."""
         # Use the BF6 profile file you provided for testing
@@ -104,6 +121,33 @@ class PathConfig:
         
         return all_paths
     
+    def get_cached_config_path(self) -> Optional[Path]:
+        """
+        Get the last detected Battlefield 6 config path, if one was remembered.
+        
+        Returns:
+            The remembered path, or None. Callers must still check that it exists.
+        """
+        # An explicit override always wins over a remembered location
+        if os.environ.get('FIELDTUNER_CONFIG_PATH'):
+            return None
+        
+        try:
+            with open(self.resolved_paths_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f).get('config_file')
+        except (OSError, ValueError, AttributeError):
+            return None
+        return Path(cached) if cached else None
+    
+    def remember_config_path(self, path: Path) -> None:
+        """Remember a detected Battlefield 6 config path for the next launch."""
+        try:
+            self.resolved_paths_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.resolved_paths_file, 'w', encoding='utf-8') as f:
+                json.dump({'config_file': str(path)}, f)
+        except OSError:
+            pass
+    
     def get_project_root(self) -> Path:
         """Get the project root directory."""
         return Path(__file__).parent.parent.parent
@@ -9,6 +9,7 @@ import os
 import logging
 import traceback
 import json
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from core.path_config import path_config
@@ -23,9 +24,12 @@ class DebugLogger(QObject):
     
     def __init__(self):
         super().__init__()
+        self._testing_buffer = None
         self.setup_logging()
-        self.log_buffer = []
         self.max_buffer_size = 1000
+        # Appended from the ErrorHandler log worker as well as the UI thread;
+        # the deque trims itself in place so neither can drop the other's entries
+        self.log_buffer = deque(maxlen=self.max_buffer_size)
     
     def setup_logging(self):
         """Setup comprehensive logging system."""
@@ -62,6 +66,9 @@ class DebugLogger(QObject):
         """Log message to dedicated testing log file."""
         try:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            if self._testing_buffer is not None:
+                self._testing_buffer.append(f"{timestamp} - {message}")
+                return
             with open(self.testing_log_file, 'a', encoding='utf-8') as f:
                 f.write(f"{timestamp} - {message}\n")
         except Exception as e:
@@ -87,8 +94,17 @@ class DebugLogger(QObject):
         self.logger.error(formatted_msg)
         
         if exception:
+            # Errors that carry their own formatted traceback (FieldTunerError)
+            # log it, so they are right even away from the except block; so
+            # does any exception that was raised, via its __traceback__
+            tb = getattr(exception, 'traceback', None)
+            if not isinstance(tb, str):
+                if getattr(exception, '__traceback__', None) is not None:
+                    tb = "".join(traceback.format_exception(exception))
+                else:
+                    tb = traceback.format_exc()
             self.logger.error(f"Exception: {str(exception)}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self.logger.error(f"Traceback: {tb}")
         
         self.add_to_buffer("ERROR", formatted_msg)
         self.log_to_testing_file(f"ERROR - {formatted_msg}")
@@ -106,16 +122,12 @@ class DebugLogger(QObject):
         
         self.log_buffer.append(log_entry)
         
-        # Keep buffer size manageable
-        if len(self.log_buffer) > self.max_buffer_size:
-            self.log_buffer = self.log_buffer[-self.max_buffer_size:]
-        
         # Emit signal for GUI updates
         self.log_updated.emit(log_entry)
     
     def get_recent_logs(self, count=50):
         """Get recent log entries."""
-        return self.log_buffer[-count:] if self.log_buffer else []
+        return list(self.log_buffer)[-count:] if self.log_buffer else []
     
     def export_logs(self, file_path=None):
         """Export logs to file."""
@@ -126,7 +138,7 @@ class DebugLogger(QObject):
         log_data = {
             "timestamp": datetime.now().isoformat(),
             "log_file": str(self.log_file),
-            "entries": self.log_buffer,
+            "entries": list(self.log_buffer),
             "system_info": self.get_system_info()
         }
         
@@ -242,6 +254,81 @@ class DebugWindow:
 debug_logger = DebugLogger()
 
 
+class _DequeHandler(logging.Handler):
+    """Logging handler that only collects records in memory."""
+    
+    def __init__(self, records):
+        super().__init__()
+        self.records = records
+    
+    def emit(self, record):
+        self.records.append(record)
+
+
+class BufferedStartupLogger:
+    """
+    Hold log file output in memory during startup.
+    
+    While active, records bound for the log files are kept in a deque
+    instead of being written one by one. On exit, including when an
+    exception propagates, each file receives them in a single write and
+    flush; flush() does the same early, e.g. before a blocking dialog.
+    Console output is not affected.
+    """
+    
+    def __init__(self, logger=None):
+        self.debug_logger = logger or debug_logger
+        self._file_handlers = []
+        self._records = deque()
+        self._buffer_handler = None
+    
+    def __enter__(self):
+        root = logging.getLogger()
+        self._file_handlers = [h for h in root.handlers if isinstance(h, logging.FileHandler)]
+        self._buffer_handler = _DequeHandler(self._records)
+        for handler in self._file_handlers:
+            root.removeHandler(handler)
+        root.addHandler(self._buffer_handler)
+        self.debug_logger._testing_buffer = []
+        return self
+    
+    def flush(self):
+        """Write out everything buffered so far; buffering continues until exit."""
+        for handler in self._file_handlers:
+            lines = [handler.format(r) for r in self._records if r.levelno >= handler.level]
+            if lines:
+                handler.acquire()
+                try:
+                    if handler.stream is None:
+                        handler.setStream(open(handler.baseFilename, handler.mode,
+                                               encoding=handler.encoding))
+                    handler.stream.write('\n'.join(lines) + '\n')
+                    handler.stream.flush()
+                except Exception as e:
+                    print(f"Failed to flush startup log: {e}")
+                finally:
+                    handler.release()
+        self._records.clear()
+        
+        testing_lines = self.debug_logger._testing_buffer
+        if testing_lines:
+            self.debug_logger._testing_buffer = []
+            try:
+                with open(self.debug_logger.testing_log_file, 'a', encoding='utf-8') as f:
+                    f.write('\n'.join(testing_lines) + '\n')
+            except Exception as e:
+                print(f"Failed to write to testing log: {e}")
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        root = logging.getLogger()
+        root.removeHandler(self._buffer_handler)
+        for handler in self._file_handlers:
+            root.addHandler(handler)
+        self.flush()
+        self.debug_logger._testing_buffer = None
+        return False
+
+
 def log_info(message, category="GENERAL"):
     """Log info message."""
     debug_logger.log_info(message, category)
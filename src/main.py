@@ -12,17 +12,20 @@ import json
 import subprocess
 from pathlib import Path
 from datetime import datetime
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QTabWidget, QLabel, QPushButton, QSlider, QCheckBox, QComboBox,
-    QSpinBox, QDoubleSpinBox, QGroupBox, QGridLayout, QTextEdit,
+    QSpinBox, QDoubleSpinBox, QGroupBox, QTextEdit,
     QMessageBox, QFileDialog, QStatusBar, QProgressBar, QSplitter,
     QListWidget, QListWidgetItem, QFrame, QScrollArea, QPlainTextEdit,
     QPushButton, QLineEdit, QFormLayout, QButtonGroup, QRadioButton,
     QStackedWidget, QSizePolicy, QSpacerItem, QLayout, QDialog,
     QDialogButtonBox, QTextBrowser, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QSize
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QSize, QPoint, QRect, QSignalBlocker
 from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QTextCursor, QPixmap, QPainter, QLinearGradient
 
 # Import debug system
@@ -31,10 +34,147 @@ from debug import debug_logger, log_info, log_warning, log_error, log_debug, get
 # Import JSON for pinned settings persistence
 import json
 
+# Import the BF6 settings database
+from settings_database import BF6_SETTINGS_DATABASE
+
 # Import centralized path configuration
 from src.core.path_config import path_config
 
 
+# Shared Advanced tab stylesheets. Row, label, group, text-field and star rules
+# are applied once on the settings container and matched by object name (and
+# the star's "favorited" property), so Qt parses them a single time instead of
+# once per setting widget.
+_QSS_ROW = """
+    QWidget#settingRow {
+        background-color: #333;
+        border-radius: 6px;
+        padding: 12px;
+        margin: 2px;
+    }
+"""
+
+_QSS_NAME = """
+    QLabel#settingName {
+        font-weight: bold;
+        color: #ffffff;
+        font-size: 14px;
+        background: transparent;
+        border: none;
+        padding: 0px;
+        margin: 0px;
+    }
+"""
+
+_QSS_DESC = """
+    QLabel#settingDesc {
+        color: #cccccc;
+        font-size: 12px;
+        background: transparent;
+        border: none;
+        padding: 0px;
+        margin: 0px;
+    }
+"""
+
+_QSS_CATEGORY_GROUP = """
+    QGroupBox#settingCategory {
+        font-weight: bold;
+        color: #ffffff;
+        border: 1px solid #4a90e2;
+        border-radius: 6px;
+        margin-top: 6px;
+        padding-top: 10px;
+        background-color: #2a2a2a;
+    }
+    QGroupBox#settingCategory::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 8px 0 8px;
+        font-size: 13px;
+    }
+"""
+
+_QSS_LINEEDIT = """
+    QLineEdit#settingText {
+        background-color: #444;
+        color: white;
+        border: 1px solid #666;
+        padding: 5px;
+        border-radius: 4px;
+        min-width: 120px;
+    }
+    QLineEdit#settingText:focus {
+        border-color: #4a90e2;
+    }
+"""
+
+# FocusAwareSpinBox sets its own stylesheet, which outranks the container's,
+# so spinboxes still get this one directly (shared string, no per-call build).
+_QSS_SPINBOX = """
+    QDoubleSpinBox {
+        background-color: #444;
+        color: white;
+        border: 1px solid #666;
+        padding: 5px;
+        border-radius: 4px;
+        min-width: 80px;
+    }
+    QDoubleSpinBox:focus {
+        border-color: #4a90e2;
+    }
+"""
+
+_QSS_STAR_STATES = """
+    QPushButton#settingStar {
+        border-radius: 16px;
+        font-size: 16px;
+    }
+    QPushButton#settingStar[favorited="true"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(255, 193, 7, 0.3),
+            stop:1 rgba(255, 193, 7, 0.1));
+        border: 2px solid #ffc107;
+        color: #ffc107;
+        font-weight: bold;
+    }
+    QPushButton#settingStar[favorited="true"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(255, 215, 0, 0.4),
+            stop:1 rgba(255, 193, 7, 0.2));
+        border: 2px solid #ffd700;
+        color: #ffd700;
+    }
+    QPushButton#settingStar[favorited="true"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(255, 193, 7, 0.5),
+            stop:1 rgba(255, 193, 7, 0.3));
+    }
+    QPushButton#settingStar[favorited="false"] {
+        background: transparent;
+        border: 2px solid #666;
+        color: #888;
+        font-weight: normal;
+    }
+    QPushButton#settingStar[favorited="false"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(255, 193, 7, 0.1),
+            stop:1 rgba(255, 193, 7, 0.05));
+        border: 2px solid #ffc107;
+        color: #ffc107;
+    }
+    QPushButton#settingStar[favorited="false"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(255, 193, 7, 0.2),
+            stop:1 rgba(255, 193, 7, 0.1));
+    }
+"""
+
+_QSS_SETTINGS_PANEL = (
+    _QSS_ROW + _QSS_NAME + _QSS_DESC + _QSS_CATEGORY_GROUP + _QSS_LINEEDIT + _QSS_STAR_STATES
+)
+
+
 class FavoritesManager:
     """Manages favorite settings state persistence."""
     
@@ -229,13 +369,6 @@ class ProfessionalToggleSwitch(QWidget):
         super().__init__(parent)
         self.setFixedSize(52, 28)
         self.is_on = False
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2a2a2a;
-                border: 2px solid #404040;
-                border-radius: 14px;
-            }
-        """)
         
     def mousePressEvent(self, event):
         self.toggle()
@@ -254,22 +387,8 @@ class ProfessionalToggleSwitch(QWidget):
         return self.is_on
     
     def update_style(self):
-        if self.is_on:
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: #4a90e2;
-                    border: 2px solid #4a90e2;
-                    border-radius: 14px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: #2a2a2a;
-                    border: 2px solid #404040;
-                    border-radius: 14px;
-                }
-            """)
+        # paintEvent draws both states itself, so a repaint is all that is needed
+        self.update()
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -1400,6 +1519,15 @@ class ConfigManager:
         self.config_data[key] = str(value)
         log_debug(f"Setting {key} = {value}", "CONFIG")
     
+    def get_all_settings(self):
+        """Get a snapshot of all configuration setting values."""
+        return dict(self.config_data)
+    
+    def set_settings_bulk(self, settings):
+        """Set many configuration setting values in a single update."""
+        self.config_data.update({key: str(value) for key, value in settings.items()})
+        log_debug(f"Set {len(settings)} settings in bulk", "CONFIG")
+    
     def apply_optimal_settings(self, preset):
         """Apply optimal settings preset."""
         if preset in self.optimal_settings:
@@ -1433,9 +1561,6 @@ class ConfigManager:
         """Reset all settings to factory defaults."""
         log_info("Resetting config to factory defaults", "CONFIG")
         
-        # Import the settings database to get default values
-        from settings_database import BF6_SETTINGS_DATABASE
-        
         # Reset all settings to their default values
         for setting_key, setting_data in BF6_SETTINGS_DATABASE.items():
             default_value = setting_data.get("default")
@@ -1779,9 +1904,10 @@ class PresetCard(QWidget):
 class QuickSettingsTab(QWidget):
     """Super slick quick settings tab."""
     
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, main_window=None):
         super().__init__()
         self.config_manager = config_manager
+        self.main_window = main_window
         self.setup_ui()
         self.load_settings()
     
@@ -2198,24 +2324,7 @@ class QuickSettingsTab(QWidget):
                     if child:
                         child.setParent(None)
             
-            # Get main window's favorites manager - try multiple ways to find it
-            main_window = None
-            
-            # Try to get main window from parent hierarchy
-            current = self.parent()
-            while current and not hasattr(current, 'favorites_manager'):
-                current = current.parent()
-            
-            if current and hasattr(current, 'favorites_manager'):
-                main_window = current
-            else:
-                # Try alternative approach - look for main window in application
-                from PyQt6.QtWidgets import QApplication
-                for widget in QApplication.allWidgets():
-                    if hasattr(widget, 'favorites_manager'):
-                        main_window = widget
-                        break
-            
+            main_window = self.get_main_window()
             if main_window and hasattr(main_window, 'favorites_manager'):
                 favorite_settings = main_window.favorites_manager.get_favorites()
                 
@@ -2336,27 +2445,20 @@ class QuickSettingsTab(QWidget):
             line_edit.editingFinished.connect(lambda key=setting_key: self.config_manager.set_setting(key, line_edit.text()))
             return line_edit
     
-    def remove_favorite_setting(self, setting_key):
-        """Remove a setting from favorites."""
+    def get_main_window(self):
+        """Return the main window that owns the favorites manager, if any."""
+        if self.main_window is not None:
+            return self.main_window
         
-        # Get main window's favorites manager - try multiple ways to find it
-        main_window = None
-        
-        # Try to get main window from parent hierarchy
+        # Not handed a main window - fall back to the parent hierarchy
         current = self.parent()
         while current and not hasattr(current, 'favorites_manager'):
             current = current.parent()
-        
-        if current and hasattr(current, 'favorites_manager'):
-            main_window = current
-        else:
-            # Try alternative approach - look for main window in application
-            from PyQt6.QtWidgets import QApplication
-            for widget in QApplication.allWidgets():
-                if hasattr(widget, 'favorites_manager'):
-                    main_window = widget
-                    break
-        
+        return current
+    
+    def remove_favorite_setting(self, setting_key):
+        """Remove a setting from favorites."""
+        main_window = self.get_main_window()
         if main_window and hasattr(main_window, 'favorites_manager'):
             main_window.favorites_manager.remove_favorite(setting_key)
             self.refresh_favorites()
@@ -3386,6 +3488,42 @@ class LoadingOverlay(QWidget):
         self.hide()
 
 
+class ToastLabel(QLabel):
+    """Non-modal, self-hiding notification shown at the bottom of its parent."""
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setStyleSheet("""
+            QLabel {
+                background-color: rgba(42, 42, 42, 0.95);
+                color: #ffffff;
+                border: 1px solid #4a90e2;
+                border-radius: 6px;
+                padding: 8px 16px;
+                font-size: 12px;
+                font-weight: bold;
+            }
+        """)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        
+        # One reusable timer so back-to-back messages restart the countdown
+        self._hide_timer = QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self.hide)
+        self.hide()
+    
+    def show_message(self, text, duration_ms=1500):
+        """Show text for duration_ms milliseconds without blocking the event loop."""
+        self.setText(text)
+        self.adjustSize()
+        parent = self.parentWidget()
+        self.move((parent.width() - self.width()) // 2, parent.height() - self.height() - 24)
+        self.show()
+        self.raise_()
+        self._hide_timer.start(duration_ms)
+
+
 class MainWindow(QMainWindow):
     """Super slick main window with world-class design."""
     
@@ -4024,7 +4162,7 @@ Backup Directory: {self.config_manager.BACKUP_DIR}
         """)
         
         # Create tabs
-        self.quick_tab = QuickSettingsTab(self.config_manager)
+        self.quick_tab = QuickSettingsTab(self.config_manager, self)
         self.graphics_tab = GraphicsTab(self.config_manager)
         self.input_tab = InputTab(self.config_manager)
         self.advanced_tab = None  # Defer creation to avoid startup hang
@@ -4915,13 +5053,29 @@ Backup Directory: {self.config_manager.BACKUP_DIR}
 class AdvancedTab(QWidget):
     """Advanced Settings Tab - Clean, searchable interface for all BF6 settings."""
     
+    # Numeric setting type -> (decimals, single step, default range, cast, fallback default)
+    _SPINBOX_SPECS = {
+        "int": (0, 1, [0, 100], int, 0),
+        "float": (2, 0.1, [0.0, 100.0], float, 0.0),
+    }
+    
     def __init__(self, config_manager, main_window=None):
         super().__init__()
         self.config_manager = config_manager
         self.main_window = main_window
         self.all_settings = {}  # Store all settings for search
+        self._ordered_items = []  # [(category, name, key, data)] sorted by (category, name)
+        self._categories_sorted = []  # _ordered_items grouped as [(category, [(key, data), ...])]
+        self._category_order = ()  # Sorted category names present in the database
+        self._star_buttons = {}  # setting_key -> star button
+        self._current_values = {}  # Snapshot of config values, refreshed per render
+        self._materialize_pending = False  # A deferred control-creation pass is queued
         self.settings_loaded = False  # Track if settings have been loaded
+        self._widget_pool = {}  # setting_key -> row widget, reused across searches
+        self._category_pool = {}  # category -> (group box, layout)
+        self._no_results_label = None
         self.setup_ui()
+        self._toast = ToastLabel(self)
         # Don't load settings during initialization - wait for user to click tab
     
     def setup_ui(self):
@@ -5088,6 +5242,7 @@ class AdvancedTab(QWidget):
         
         self.settings_widget = QWidget()
         self.settings_widget.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)  # Don't expand vertically
+        self.settings_widget.setStyleSheet(_QSS_SETTINGS_PANEL)
         self.settings_layout = QVBoxLayout(self.settings_widget)
         self.settings_layout.setContentsMargins(8, 8, 8, 8)
         self.settings_layout.setSpacing(8)
@@ -5097,6 +5252,11 @@ class AdvancedTab(QWidget):
         self.settings_scroll.setWidget(self.settings_widget)
         layout.addWidget(self.settings_scroll)
         
+        # Create row controls only once they scroll into view
+        scroll_bar = self.settings_scroll.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.schedule_control_materialization)
+        scroll_bar.rangeChanged.connect(self.schedule_control_materialization)
+        
         # Status label
         self.status_label = QLabel("Ready")
         self.status_label.setStyleSheet("""
@@ -5120,19 +5280,25 @@ class AdvancedTab(QWidget):
             self.results_label.setText("Loading settings...")
             self.status_label.setText("Loading...")
             
-            from settings_database import BF6_SETTINGS_DATABASE
+            # Store all settings for search (the database is never mutated)
+            self.all_settings = BF6_SETTINGS_DATABASE
             
-            # Store all settings for search
-            self.all_settings = BF6_SETTINGS_DATABASE.copy()
+            # Sort once here; searches only filter this list and regroup it
+            self._ordered_items = sorted(
+                (
+                    (setting_data.get("category", "Other"), setting_data.get("name", ""), setting_key, setting_data)
+                    for setting_key, setting_data in self.all_settings.items()
+                ),
+                key=itemgetter(0, 1),
+            )
+            self._categories_sorted = self.group_by_category(self._ordered_items)
+            self._category_order = tuple(category_name for category_name, _ in self._categories_sorted)
             
             # Clear existing settings
             self.clear_settings_display()
             
             # Display all settings initially
-            self.display_settings(self.all_settings)
-            
-            # Refresh star button states after loading
-            QTimer.singleShot(100, self.refresh_star_button_states)
+            self.display_settings(self._categories_sorted)
             
             self.results_label.setText(f"Showing {len(self.all_settings)} settings")
             self.status_label.setText("Ready")
@@ -5143,89 +5309,146 @@ class AdvancedTab(QWidget):
             self.status_label.setText("Error")
     
     def clear_settings_display(self):
-        """Clear all settings from the display."""
-        for i in reversed(range(self.settings_layout.count())):
-            child = self.settings_layout.itemAt(i).widget()
+        """Detach all settings from the display, keeping widgets pooled for reuse."""
+        while self.settings_layout.count():
+            item = self.settings_layout.takeAt(0)
+            child = item.widget()
             if child:
-                child.setParent(None)
+                child.hide()
     
-    def display_settings(self, settings_dict):
-        """Display the given settings dictionary."""
-        if not settings_dict:
+    def display_settings(self, grouped_settings):
+        """Display settings given as [(category, [(key, data), ...])] in display order."""
+        # One bulk fetch per render instead of a get_setting call per row
+        self._current_values = self.config_manager.get_all_settings()
+        
+        if not grouped_settings:
             # Show no results message
-            no_results = QLabel("No settings found matching your search criteria.")
-            no_results.setStyleSheet("""
-                color: #888;
-                font-size: 14px;
-                padding: 20px;
-                text-align: center;
-            """)
-            no_results.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.settings_layout.addWidget(no_results)
+            if self._no_results_label is None:
+                self._no_results_label = QLabel("No settings found matching your search criteria.")
+                self._no_results_label.setStyleSheet("""
+                    color: #888;
+                    font-size: 14px;
+                    padding: 20px;
+                    text-align: center;
+                """)
+                self._no_results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.settings_layout.addWidget(self._no_results_label)
+            self._no_results_label.show()
             return
         
-        # Group settings by category
-        categories = {}
-        for setting_key, setting_data in settings_dict.items():
-            category = setting_data.get("category", "Other")
-            if category not in categories:
-                categories[category] = []
-            categories[category].append((setting_key, setting_data))
-        
         # Create category sections
-        for category_name, settings in sorted(categories.items()):
+        for category_name, settings in grouped_settings:
             if not settings:
                 continue
-                
-            # Category header with consistent, readable styling and size constraints
-            category_group = QGroupBox(f"📁 {category_name} ({len(settings)} settings)")
-            category_group.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)  # Don't expand vertically
-            category_group.setMaximumHeight(400)  # Limit maximum height to prevent excessive expansion
-            category_group.setStyleSheet("""
-                QGroupBox {
-                    font-weight: bold;
-                    color: #ffffff;
-                    border: 1px solid #4a90e2;
-                    border-radius: 6px;
-                    margin-top: 6px;
-                    padding-top: 10px;
-                    background-color: #2a2a2a;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 8px 0 8px;
-                    font-size: 13px;
-                }
-            """)
             
-            category_layout = QVBoxLayout(category_group)
-            category_layout.setContentsMargins(10, 10, 10, 10)  # Consistent good margins
-            category_layout.setSpacing(6)  # Consistent good spacing
-            
-            # Add settings for this category
-            for setting_key, setting_data in sorted(settings, key=lambda x: x[1].get("name", "")):
-                setting_widget = self.create_setting_widget(setting_key, setting_data)
+            category_group, category_layout = self.get_category_group(category_name)
+            category_group.setTitle(f"📁 {category_name} ({len(settings)} settings)")
+            
+            # Detach the previous rows of this category before re-inserting the visible subset
+            while category_layout.count():
+                item = category_layout.takeAt(0)
+                if item.widget():
+                    item.widget().hide()
+            
+            # Add settings for this category, reusing pooled rows where possible
+            for setting_key, setting_data in settings:
+                setting_widget = self._widget_pool.get(setting_key)
+                if setting_widget is None:
+                    setting_widget = self.create_setting_widget(setting_key, setting_data)
+                    self._widget_pool[setting_key] = setting_widget
+                else:
+                    self.sync_setting_widget(setting_widget, setting_key, setting_data)
                 category_layout.addWidget(setting_widget)
+                setting_widget.show()
             
             self.settings_layout.addWidget(category_group)
+            category_group.show()
+        
+        self.schedule_control_materialization()
+    
+    def get_category_group(self, category_name):
+        """Return the pooled group box and layout for a category, creating them on first use."""
+        if category_name in self._category_pool:
+            return self._category_pool[category_name]
+        
+        # Category header with consistent, readable styling and size constraints
+        category_group = QGroupBox()
+        category_group.setObjectName("settingCategory")
+        category_group.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)  # Don't expand vertically
+        category_group.setMaximumHeight(400)  # Limit maximum height to prevent excessive expansion
+        
+        category_layout = QVBoxLayout(category_group)
+        category_layout.setContentsMargins(10, 10, 10, 10)  # Consistent good margins
+        category_layout.setSpacing(6)  # Consistent good spacing
+        
+        self._category_pool[category_name] = (category_group, category_layout)
+        return category_group, category_layout
+    
+    def sync_setting_widget(self, setting_widget, setting_key, setting_data):
+        """Bring a pooled setting row up to date without rebuilding it."""
+        is_favorited = False
+        if self.main_window and hasattr(self.main_window, 'favorites_manager'):
+            is_favorited = self.main_window.favorites_manager.is_favorite(setting_key)
+        self._apply_star_style(self._star_buttons[setting_key], is_favorited)
+        
+        # Rows whose control hasn't been created yet pick up the value on creation
+        if setting_widget.control_widget is not None:
+            current_value = self._current_values.get(setting_key, "")
+            self.set_control_value(setting_widget.control_widget, setting_data, current_value)
+    
+    def schedule_control_materialization(self):
+        """Queue a pass that creates controls for rows in the viewport."""
+        if not self._materialize_pending:
+            self._materialize_pending = True
+            QTimer.singleShot(0, self.materialize_visible_controls)
+    
+    def materialize_visible_controls(self):
+        """Replace control placeholders with real controls for rows intersecting the viewport."""
+        self._materialize_pending = False
+        viewport = self.settings_scroll.viewport()
+        visible_rect = viewport.rect()
+        
+        for setting_key, setting_widget in self._widget_pool.items():
+            if setting_widget.control_widget is not None or not setting_widget.isVisibleTo(self.settings_widget):
+                continue
+            
+            row_rect = QRect(setting_widget.mapTo(viewport, QPoint(0, 0)), setting_widget.size())
+            if not row_rect.intersects(visible_rect):
+                continue
+            
+            control_widget = self.create_control_widget(
+                setting_key, setting_widget.setting_data, self._current_values.get(setting_key, "")
+            )
+            setting_widget.layout().replaceWidget(setting_widget.control_placeholder, control_widget)
+            setting_widget.control_placeholder.deleteLater()
+            setting_widget.control_placeholder = None
+            setting_widget.control_widget = control_widget
     
     def perform_search(self):
         """Perform search and filter settings."""
         search_text = self.search_input.text().lower().strip()
         category_filter = self.category_filter.currentText()
         
-        # Filter settings
-        filtered_settings = {}
-        for setting_key, setting_data in self.all_settings.items():
+        # Resolve the category filter against the known categories once, not per setting
+        allowed_categories = None
+        if category_filter != "All Categories":
+            allowed_categories = {
+                category_name for category_name in self._category_order if category_filter in category_name
+            }
+        
+        # Filter the pre-sorted items, preserving their order
+        filtered_items = []
+        for item in self._ordered_items:
+            category_name, setting_name, setting_key, setting_data = item
+            
             # Check category filter
-            if category_filter != "All Categories" and category_filter not in setting_data.get("category", ""):
+            if allowed_categories is not None and category_name not in allowed_categories:
                 continue
             
             # Check search text
             if search_text:
                 searchable_text = (
-                    setting_data.get("name", "") + " " +
+                    setting_name + " " +
                     setting_data.get("description", "") + " " +
                     setting_data.get("tooltip", "") + " " +
                     setting_key
@@ -5234,17 +5457,16 @@ class AdvancedTab(QWidget):
                 if search_text not in searchable_text:
                     continue
             
-            filtered_settings[setting_key] = setting_data
+            filtered_items.append(item)
+        
+        filtered_settings = self.group_by_category(filtered_items)
+        count = len(filtered_items)
         
         # Update display
         self.clear_settings_display()
         self.display_settings(filtered_settings)
         
-        # Refresh star button states after adding widgets
-        QTimer.singleShot(100, self.refresh_star_button_states)
-        
         # Update results count
-        count = len(filtered_settings)
         if search_text or category_filter != "All Categories":
             self.results_label.setText(f"Found {count} settings matching your criteria")
         else:
@@ -5256,18 +5478,18 @@ class AdvancedTab(QWidget):
         self.category_filter.setCurrentIndex(0)
         self.perform_search()
     
+    def group_by_category(self, ordered_items):
+        """Group (category, name, key, data) items, already sorted by category, for display."""
+        return [
+            (category_name, [(setting_key, setting_data) for _, _, setting_key, setting_data in items])
+            for category_name, items in groupby(ordered_items, key=itemgetter(0))
+        ]
+    
     def create_setting_widget(self, setting_key, setting_data):
         """Create a widget for a single setting."""
         widget = QWidget()
+        widget.setObjectName("settingRow")
         widget.setMinimumHeight(60)  # Ensure minimum height for readability
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: #333;
-                border-radius: 6px;
-                padding: 12px;
-                margin: 2px;
-            }
-        """)
         
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(12, 12, 12, 12)  # Better margins for readability
@@ -5280,33 +5502,15 @@ class AdvancedTab(QWidget):
         setting_name = setting_data.get("name", setting_key)
         setting_desc = setting_data.get("description", "")
         
-        # Debug: Log setting info
-        log_debug(f"Creating setting widget: {setting_key} -> {setting_name} | {setting_desc}", "ADVANCED")
-        
         # Name label with better visibility
         name_label = QLabel(setting_name)
-        name_label.setStyleSheet("""
-            font-weight: bold;
-            color: #ffffff;
-            font-size: 14px;
-            background: transparent;
-            border: none;
-            padding: 0px;
-            margin: 0px;
-        """)
+        name_label.setObjectName("settingName")
         name_label.setWordWrap(True)
         info_layout.addWidget(name_label)
         
         # Description label with better visibility
         desc_label = QLabel(setting_desc)
-        desc_label.setStyleSheet("""
-            color: #cccccc;
-            font-size: 12px;
-            background: transparent;
-            border: none;
-            padding: 0px;
-            margin: 0px;
-        """)
+        desc_label.setObjectName("settingDesc")
         desc_label.setWordWrap(True)
         info_layout.addWidget(desc_label)
         
@@ -5317,6 +5521,8 @@ class AdvancedTab(QWidget):
         star_button = QPushButton()
         star_button.setFixedSize(32, 32)
         star_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        star_button.setObjectName("settingStar")
+        self._star_buttons[setting_key] = star_button
         
         # Check if this setting is already favorited
         is_favorited = False
@@ -5324,87 +5530,33 @@ class AdvancedTab(QWidget):
             is_favorited = self.main_window.favorites_manager.is_favorite(setting_key)
         
         # Set initial state with enhanced styling
-        if is_favorited:
-            star_button.setText("★")
-            star_button.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(255, 193, 7, 0.3),
-                        stop:1 rgba(255, 193, 7, 0.1));
-                    border: 2px solid #ffc107;
-                    border-radius: 16px;
-                    color: #ffc107;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(255, 215, 0, 0.4),
-                        stop:1 rgba(255, 193, 7, 0.2));
-                    border: 2px solid #ffd700;
-                    color: #ffd700;
-                    transform: scale(1.1);
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(255, 193, 7, 0.5),
-                        stop:1 rgba(255, 193, 7, 0.3));
-                    transform: scale(0.95);
-                }
-            """)
-            star_button.setToolTip("⭐ Remove from Favorites")
-        else:
-            star_button.setText("☆")
-            star_button.setStyleSheet("""
-                QPushButton {
-                    background: transparent;
-                    border: 2px solid #666;
-                    border-radius: 16px;
-                    color: #888;
-                    font-size: 16px;
-                    font-weight: normal;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(255, 193, 7, 0.1),
-                        stop:1 rgba(255, 193, 7, 0.05));
-                    border: 2px solid #ffc107;
-                    color: #ffc107;
-                    transform: scale(1.05);
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(255, 193, 7, 0.2),
-                        stop:1 rgba(255, 193, 7, 0.1));
-                    transform: scale(0.95);
-                }
-            """)
-            star_button.setToolTip("⭐ Add to Favorites")
+        self._apply_star_style(star_button, is_favorited)
         
         # Connect with enhanced feedback
         star_button.clicked.connect(lambda: self.toggle_favorite_setting(setting_key, setting_data))
         layout.addWidget(star_button)
         
-        # Control widget based on type
-        control_widget = self.create_control_widget(setting_key, setting_data)
-        layout.addWidget(control_widget)
+        # Control widget is created lazily by materialize_visible_controls
+        control_placeholder = QWidget()
+        control_placeholder.setMinimumWidth(80)
+        layout.addWidget(control_placeholder)
+        
+        # Keep handles on the row so the control can be created and refreshed in place
+        widget.setting_data = setting_data
+        widget.control_placeholder = control_placeholder
+        widget.control_widget = None
         
         return widget
     
-    def create_control_widget(self, setting_key, setting_data):
+    def create_control_widget(self, setting_key, setting_data, current_value):
         """Create the appropriate control widget for a setting."""
         setting_type = setting_data.get("type", "string")
-        # Always get the most current value from config manager
-        current_value = self.config_manager.get_setting(setting_key)
         
         if setting_type == "bool":
             # Toggle switch for boolean values
             toggle = ProfessionalToggleSwitch()
             
-            # Block signals during initialization
-            toggle.blockSignals(True)
-            toggle.set_checked(bool(current_value) if current_value is not None else setting_data.get("default", False))
-            toggle.blockSignals(False)
+            self.set_control_value(toggle, setting_data, current_value)
             
             # Connect signal AFTER initialization
             toggle.toggled.connect(lambda checked, key=setting_key: self.update_setting(key, int(checked)))
@@ -5416,111 +5568,19 @@ class AdvancedTab(QWidget):
             
             return toggle
             
-        elif setting_type == "int":
-            # SpinBox for integer values
-            spinbox = FocusAwareSpinBox()
-            spinbox.setRange(*setting_data.get("range", [0, 100]))
-            spinbox.setDecimals(0)  # Integer values
-            spinbox.setSingleStep(1)  # Integer step
-            
-            # Block signals during initialization
-            spinbox.blockSignals(True)
-            try:
-                value = int(current_value) if current_value and str(current_value).strip() else setting_data.get("default", 0)
-            except (ValueError, TypeError):
-                value = setting_data.get("default", 0)
-            spinbox.setValue(value)
-            spinbox.blockSignals(False)
-            
-            # Connect signal AFTER initialization
-            spinbox.valueChanged.connect(lambda value, key=setting_key: self.update_setting(key, value))
-            spinbox.setStyleSheet("""
-                QSpinBox {
-                    background-color: #444;
-                    color: white;
-                    border: 1px solid #666;
-                    padding: 5px;
-                    border-radius: 4px;
-                    min-width: 80px;
-                }
-                QSpinBox:focus {
-                    border-color: #4a90e2;
-                }
-            """)
-            
-            tooltip = setting_data.get("tooltip", "")
-            if tooltip:
-                spinbox.setToolTip(f"{tooltip}\n\n💡 Click to focus, then use scroll wheel to adjust")
-            else:
-                spinbox.setToolTip("💡 Click to focus, then use scroll wheel to adjust")
-            
-            return spinbox
-            
-        elif setting_type == "float":
-            # DoubleSpinBox for float values
-            spinbox = FocusAwareSpinBox()
-            spinbox.setRange(*setting_data.get("range", [0.0, 100.0]))
-            spinbox.setDecimals(2)  # Two decimal places
-            spinbox.setSingleStep(0.1)  # Float step
-            
-            # Block signals during initialization
-            spinbox.blockSignals(True)
-            try:
-                value = float(current_value) if current_value and str(current_value).strip() else setting_data.get("default", 0.0)
-            except (ValueError, TypeError):
-                value = setting_data.get("default", 0.0)
-            spinbox.setValue(value)
-            spinbox.setDecimals(2)
-            spinbox.blockSignals(False)
-            
-            # Connect signal AFTER initialization
-            spinbox.valueChanged.connect(lambda value, key=setting_key: self.update_setting(key, value))
-            spinbox.setStyleSheet("""
-                QDoubleSpinBox {
-                    background-color: #444;
-                    color: white;
-                    border: 1px solid #666;
-                    padding: 5px;
-                    border-radius: 4px;
-                    min-width: 80px;
-                }
-                QDoubleSpinBox:focus {
-                    border-color: #4a90e2;
-                }
-            """)
-            
-            tooltip = setting_data.get("tooltip", "")
-            if tooltip:
-                spinbox.setToolTip(f"{tooltip}\n\n💡 Click to focus, then use scroll wheel to adjust")
-            else:
-                spinbox.setToolTip("💡 Click to focus, then use scroll wheel to adjust")
-            
-            return spinbox
+        elif setting_type in self._SPINBOX_SPECS:
+            # SpinBox for numeric values
+            decimals, step, default_range = self._SPINBOX_SPECS[setting_type][:3]
+            return self._make_spinbox(setting_key, setting_data, current_value, decimals, step, default_range)
             
         else:
             # Text input for string values
             line_edit = QLineEdit()
-            
-            # Block signals during initialization
-            line_edit.blockSignals(True)
-            line_edit.setText(str(current_value) if current_value is not None else str(setting_data.get("default", "")))
-            line_edit.blockSignals(False)
+            line_edit.setObjectName("settingText")
+            self.set_control_value(line_edit, setting_data, current_value)
             
             # Use editingFinished instead of textChanged for intentional changes only
             line_edit.editingFinished.connect(lambda key=setting_key: self.update_setting(key, line_edit.text()))
-            line_edit.setStyleSheet("""
-                QLineEdit {
-                    background-color: #444;
-                    color: white;
-                    border: 1px solid #666;
-                    padding: 5px;
-                    border-radius: 4px;
-                    min-width: 120px;
-                }
-                QLineEdit:focus {
-                    border-color: #4a90e2;
-                }
-            """)
             
             tooltip = setting_data.get("tooltip", "")
             if tooltip:
@@ -5528,6 +5588,45 @@ class AdvancedTab(QWidget):
             
             return line_edit
     
+    def _make_spinbox(self, setting_key, setting_data, current_value, decimals, step, default_range):
+        """Create a numeric spinbox; int and float settings differ only in decimals and step."""
+        spinbox = FocusAwareSpinBox()
+        spinbox.setRange(*setting_data.get("range", default_range))
+        spinbox.setDecimals(decimals)
+        spinbox.setSingleStep(step)
+        self.set_control_value(spinbox, setting_data, current_value)
+        
+        # Connect signal AFTER initialization
+        spinbox.valueChanged.connect(lambda value, key=setting_key: self.update_setting(key, value))
+        spinbox.setStyleSheet(_QSS_SPINBOX)
+        
+        tooltip = setting_data.get("tooltip", "")
+        if tooltip:
+            spinbox.setToolTip(f"{tooltip}\n\n💡 Click to focus, then use scroll wheel to adjust")
+        else:
+            spinbox.setToolTip("💡 Click to focus, then use scroll wheel to adjust")
+        
+        return spinbox
+    
+    def set_control_value(self, control, setting_data, current_value):
+        """Push a value into a control widget without emitting change signals."""
+        setting_type = setting_data.get("type", "string")
+        
+        # Block signals so initialization/refresh isn't mistaken for a user edit;
+        # QSignalBlocker restores the previous state even if a conversion raises
+        with QSignalBlocker(control):
+            if setting_type == "bool":
+                control.set_checked(bool(current_value) if current_value is not None else setting_data.get("default", False))
+            elif setting_type in self._SPINBOX_SPECS:
+                cast, fallback = self._SPINBOX_SPECS[setting_type][3:]
+                try:
+                    value = cast(current_value) if current_value and str(current_value).strip() else setting_data.get("default", fallback)
+                except (ValueError, TypeError):
+                    value = setting_data.get("default", fallback)
+                control.setValue(value)
+            else:
+                control.setText(str(current_value) if current_value is not None else str(setting_data.get("default", "")))
+    
     def update_setting(self, setting_key, value):
         """Update a setting value and track changes."""
         try:
@@ -5536,6 +5635,7 @@ class AdvancedTab(QWidget):
             
             # Update the setting
             self.config_manager.set_setting(setting_key, value)
+            self._current_values[setting_key] = str(value)
             
             # Track the change in the main window
             if hasattr(self.parent(), 'track_setting_change'):
@@ -5565,11 +5665,11 @@ class AdvancedTab(QWidget):
                 self.config_manager._create_backup("Before_Advanced_Reset")
                 
                 # Reset to defaults
-                from settings_database import BF6_SETTINGS_DATABASE
-                for setting_key, setting_data in BF6_SETTINGS_DATABASE.items():
-                    default_value = setting_data.get("default")
-                    if default_value is not None:
-                        self.config_manager.set_setting(setting_key, default_value)
+                self.config_manager.set_settings_bulk({
+                    setting_key: setting_data["default"]
+                    for setting_key, setting_data in BF6_SETTINGS_DATABASE.items()
+                    if setting_data.get("default") is not None
+                })
                 
                 # Reload the UI
                 self.load_settings()
@@ -5594,80 +5694,24 @@ class AdvancedTab(QWidget):
     def toggle_favorite_setting(self, setting_key, setting_data):
         """Toggle favorite status of a setting with enhanced feedback."""
         try:
-            # Use the main window reference directly
-            
             if self.main_window and hasattr(self.main_window, 'favorites_manager'):
                 setting_name = setting_data.get('name', setting_key)
+                favorites_manager = self.main_window.favorites_manager
                 
-                if self.main_window.favorites_manager.is_favorite(setting_key):
-                    # Remove from favorites
-                    self.main_window.favorites_manager.remove_favorite(setting_key)
-                    
-                    # Show success message with better styling
-                    msg = QMessageBox(self)
-                    msg.setWindowTitle("⭐ Removed from Favorites")
-                    msg.setText(f"'{setting_name}' has been removed from your favorites.")
-                    msg.setIcon(QMessageBox.Icon.Information)
-                    msg.setStyleSheet("""
-                        QMessageBox {
-                            background-color: #2a2a2a;
-                            color: #ffffff;
-                        }
-                        QMessageBox QLabel {
-                            color: #ffffff;
-                            font-size: 12px;
-                        }
-                        QMessageBox QPushButton {
-                            background-color: #4a90e2;
-                            color: white;
-                            border: none;
-                            padding: 8px 16px;
-                            border-radius: 4px;
-                            font-weight: bold;
-                        }
-                        QMessageBox QPushButton:hover {
-                            background-color: #5ba0f2;
-                        }
-                    """)
-                    msg.exec()
+                is_favorited = not favorites_manager.is_favorite(setting_key)
+                if is_favorited:
+                    favorites_manager.add_favorite(setting_key, setting_data)
                 else:
-                    # Add to favorites
-                    self.main_window.favorites_manager.add_favorite(setting_key, setting_data)
-                    
-                    # Show success message with better styling
-                    msg = QMessageBox(self)
-                    msg.setWindowTitle("⭐ Added to Favorites")
-                    msg.setText(f"'{setting_name}' has been added to your favorites!\n\nYou can now find it in the Quick Settings tab.")
-                    msg.setIcon(QMessageBox.Icon.Information)
-                    msg.setStyleSheet("""
-                        QMessageBox {
-                            background-color: #2a2a2a;
-                            color: #ffffff;
-                        }
-                        QMessageBox QLabel {
-                            color: #ffffff;
-                            font-size: 12px;
-                        }
-                        QMessageBox QPushButton {
-                            background-color: #4a90e2;
-                            color: white;
-                            border: none;
-                            padding: 8px 16px;
-                            border-radius: 4px;
-                            font-weight: bold;
-                        }
-                        QMessageBox QPushButton:hover {
-                            background-color: #5ba0f2;
-                        }
-                    """)
-                    msg.exec()
-            
-            # Refresh the current Advanced tab to update star button states
-                QTimer.singleShot(100, self.refresh_advanced_tab)
-            
-            # Refresh Quick Settings tab if it exists
+                    favorites_manager.remove_favorite(setting_key)
+                action = "added to" if is_favorited else "removed from"
+                self._toast.show_message(f"⭐ '{setting_name}' {action} favorites")
+                
+                # Update this setting's star in place
+                self._apply_star_style(self._star_buttons[setting_key], is_favorited)
+                
+                # Refresh Quick Settings tab if it exists
                 if hasattr(self.main_window, 'quick_tab'):
-                    QTimer.singleShot(200, self.main_window.quick_tab.refresh_favorites)
+                    self.main_window.quick_tab.refresh_favorites()
             else:
                 log_error("Favorites manager not found - cannot toggle favorite", "FAVORITES")
                 QMessageBox.warning(self, "Error", "Unable to access favorites manager. Please try again.")
@@ -5678,184 +5722,231 @@ class AdvancedTab(QWidget):
     def refresh_advanced_tab(self):
         """Refresh the Advanced tab to update star button states."""
         try:
-            # Find all star buttons in the current tab and update their states
-            star_buttons_found = 0
-            for widget in self.findChildren(QPushButton):
-                if widget.toolTip() and ("Add to Favorites" in widget.toolTip() or "Remove from Favorites" in widget.toolTip()):
-                    # This is a star button, update its state
-                    star_buttons_found += 1
-                    self.update_star_button_state(widget)
+            if not self.main_window or not hasattr(self.main_window, 'favorites_manager'):
+                return
+            
+            favorites_manager = self.main_window.favorites_manager
+            for setting_key, star_button in self._star_buttons.items():
+                self._apply_star_style(star_button, favorites_manager.is_favorite(setting_key))
             
             # Only log the summary, not individual button updates
-            if star_buttons_found > 0:
-                log_info(f"Updated {star_buttons_found} star button states", "FAVORITES")
+            if self._star_buttons:
+                log_info(f"Updated {len(self._star_buttons)} star button states", "FAVORITES")
         except Exception as e:
             log_error(f"Error refreshing Advanced tab: {e}", "FAVORITES", e)
     
-    def update_star_button_state(self, star_button):
-        """Update the visual state of a star button based on current favorite status."""
-        try:
-            # Extract setting key from the button's parent widget
-            setting_widget = star_button.parent()
-            if not setting_widget:
-                return
-                
-            # Find the setting key by looking for the setting name label
-            setting_name_label = None
-            for child in setting_widget.findChildren(QLabel):
-                if child.text() and not child.text().startswith("★"):
-                    setting_name_label = child
-                    break
-            
-            if not setting_name_label:
-                return
-            
-            setting_name = setting_name_label.text()
-            
-            # Find the setting key by matching the name
-            setting_key = None
-            from settings_database import BF6_SETTINGS_DATABASE
-            for key, data in BF6_SETTINGS_DATABASE.items():
-                if data.get("name") == setting_name:
-                    setting_key = key
-                    break
-            
-            if not setting_key or not self.main_window or not hasattr(self.main_window, 'favorites_manager'):
-                return
-            
-            # Update the star button state
-            is_favorited = self.main_window.favorites_manager.is_favorite(setting_key)
-            
-            if is_favorited:
-                star_button.setText("★")
-                star_button.setStyleSheet("""
-                QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 rgba(255, 193, 7, 0.3),
-                            stop:1 rgba(255, 193, 7, 0.1));
-                        border: 2px solid #ffc107;
-                        border-radius: 16px;
-                    color: #ffc107;
-                        font-size: 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 rgba(255, 215, 0, 0.4),
-                            stop:1 rgba(255, 193, 7, 0.2));
-                        border: 2px solid #ffd700;
-                    color: #ffd700;
-                        transform: scale(1.1);
-                }
-                QPushButton:pressed {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 rgba(255, 193, 7, 0.5),
-                            stop:1 rgba(255, 193, 7, 0.3));
-                        transform: scale(0.95);
-                }
-            """)
-                star_button.setToolTip("⭐ Remove from Favorites")
-            else:
-                star_button.setText("☆")
-                star_button.setStyleSheet("""
-                QPushButton {
-                    background: transparent;
-                        border: 2px solid #666;
-                        border-radius: 16px;
-                    color: #888;
-                        font-size: 16px;
-                    font-weight: normal;
-                }
-                QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 rgba(255, 193, 7, 0.1),
-                            stop:1 rgba(255, 193, 7, 0.05));
-                        border: 2px solid #ffc107;
-                    color: #ffc107;
-                        transform: scale(1.05);
-                }
-                QPushButton:pressed {
-                        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                            stop:0 rgba(255, 193, 7, 0.2),
-                            stop:1 rgba(255, 193, 7, 0.1));
-                        transform: scale(0.95);
-                }
-            """)
-                star_button.setToolTip("⭐ Add to Favorites")
-        except Exception as e:
-            log_error(f"Error updating star button state: {e}", "FAVORITES", e)
+    def _apply_star_style(self, star_button, is_favorited):
+        """Apply the favorited/unfavorited look to a star button."""
+        if star_button.property("favorited") == is_favorited:
+            return
+        
+        star_button.setText("★" if is_favorited else "☆")
+        star_button.setToolTip("⭐ Remove from Favorites" if is_favorited else "⭐ Add to Favorites")
+        
+        # The container stylesheet selects on this property; re-polish to re-match it
+        star_button.setProperty("favorited", is_favorited)
+        star_button.style().unpolish(star_button)
+        star_button.style().polish(star_button)
+
+
+class StyleCache:
+    """Shared stylesheet strings, interned on first use and reused by every widget."""
     
-    def refresh_star_button_states(self):
-        """Refresh all star button states in the Advanced tab."""
-        try:
-            # Find all star buttons and update their states
-            for widget in self.findChildren(QPushButton):
-                if widget.toolTip() and ("Add to Favorites" in widget.toolTip() or "Remove from Favorites" in widget.toolTip()):
-                    self.update_star_button_state(widget)
-        except Exception as e:
-            log_error(f"Error refreshing star button states: {e}", "FAVORITES", e)
+    _SOURCES = {
+        # Applied once on the InputTab root; children are matched by object name
+        "input": """
+        QLabel#inputHeader {
+            font-size: 28px;
+            font-weight: bold;
+            color: #ffffff;
+            margin-bottom: 16px;
+            padding: 12px 0px;
+        }
+        QLabel#inputStatus {
+            color: #888;
+            font-size: 12px;
+            padding: 5px;
+        }
+        QScrollArea#inputScroll {
+            background-color: transparent;
+            border: none;
+        }
+        QScrollArea#inputScroll QScrollBar:vertical {
+            background-color: #333;
+            width: 12px;
+            border-radius: 6px;
+        }
+        QScrollArea#inputScroll QScrollBar::handle:vertical {
+            background-color: #666;
+            border-radius: 6px;
+            min-height: 20px;
+        }
+        QScrollArea#inputScroll QScrollBar::handle:vertical:hover {
+            background-color: #888;
+        }
+        QGroupBox#inputSection {
+            font-weight: bold;
+            color: #ffffff;
+            border: 2px solid #4a90e2;
+            border-radius: 8px;
+            margin-top: 15px;
+            padding-top: 15px;
+            background-color: #2a2a2a;
+        }
+        QGroupBox#inputSection::title {
+            subcontrol-origin: margin;
+            left: 15px;
+            padding: 0 8px 0 8px;
+            font-size: 16px;
+        }
+        QLabel#inputName {
+            color: #ffffff;
+            font-size: 14px;
+            padding: 4px 0px;
+        }
+        QLabel#inputValue {
+            color: #ffffff;
+            font-weight: bold;
+            min-width: 60px;
+        }
+        QSlider#inputSlider::groove:horizontal {
+            background: #555;
+            height: 6px;
+            border-radius: 3px;
+        }
+        QSlider#inputSlider::handle:horizontal {
+            background: #4a90e2;
+            width: 18px;
+            height: 18px;
+            border-radius: 9px;
+            margin: -6px 0;
+        }
+        QSlider#inputSlider::handle:horizontal:hover {
+            background: #357abd;
+        }
+        QComboBox#inputCombo {
+            background-color: #444;
+            color: white;
+            border: 1px solid #666;
+            padding: 5px;
+            border-radius: 4px;
+            min-width: 120px;
+        }
+        QComboBox#inputCombo:focus {
+            border-color: #4a90e2;
+        }
+        QComboBox#inputCombo::drop-down {
+            border: none;
+        }
+        QComboBox#inputCombo::down-arrow {
+            image: none;
+            border-left: 5px solid transparent;
+            border-right: 5px solid transparent;
+            border-top: 5px solid #888;
+        }
+        """,
+    }
+    
+    _cache = {}
+    
+    @classmethod
+    def get(cls, name):
+        """Return the shared stylesheet string registered under name."""
+        qss = cls._cache.get(name)
+        if qss is None:
+            qss = cls._cache[name] = sys.intern(cls._SOURCES[name])
+        return qss
+
+
+# Input tab layout: (section title, ((kind, name, key, *kind-specific args, description, recommendation), ...))
+INPUT_SECTIONS = (
+    ("🖱️ Mouse Settings", (
+        ("slider", "Mouse Sensitivity", "GstInput.MouseSensitivity", 0.0, 5.0, 0.1, "Controls how fast the mouse moves the camera. Higher values = faster movement.", "Recommended: 0.5-1.5 for most players"),
+        ("toggle", "Mouse Acceleration", "GstInput.MouseAcceleration", "Enables mouse acceleration for smoother movement.", "Disable for consistent mouse movement (recommended for competitive play)"),
+        ("toggle", "Mouse Smoothing", "GstInput.MouseSmoothing", "Reduces mouse jitter and provides smoother movement.", "Enable for smoother gameplay, disable for more responsive input"),
+        ("combo", "Mouse Polling Rate", "GstInput.MousePollingRate", ("125 Hz", "250 Hz", "500 Hz", "1000 Hz"), "Higher polling rates provide more responsive mouse input.", "1000 Hz recommended for competitive play"),
+        ("slider", "Mouse DPI", "GstInput.MouseDPI", 400, 16000, 100, "Mouse DPI setting (if supported by your mouse).", "Higher DPI = more sensitive movement"),
+    )),
+    ("⌨️ Keyboard Settings", (
+        ("slider", "Key Repeat Rate", "GstInput.KeyRepeatRate", 1.0, 10.0, 0.1, "How fast keys repeat when held down.", "Higher values = faster key repetition"),
+        ("slider", "Key Repeat Delay", "GstInput.KeyRepeatDelay", 0.1, 2.0, 0.1, "Delay before key starts repeating.", "Lower values = more responsive key repetition"),
+        ("combo", "Keyboard Layout", "GstInput.KeyboardLayout", ("QWERTY", "AZERTY", "QWERTZ", "Dvorak"), "Keyboard layout for key bindings.", "Select your regional keyboard layout"),
+        ("toggle", "Sticky Keys", "GstInput.StickyKeys", "Allows modifier keys to stay active after release.", "Useful for accessibility, disable for normal gaming"),
+    )),
+    ("🎮 Controller Settings", (
+        ("slider", "Controller Sensitivity", "GstInput.ControllerSensitivity", 0.1, 3.0, 0.1, "How fast the controller moves the camera.", "Higher values = faster camera movement"),
+        ("slider", "Controller Dead Zone", "GstInput.ControllerDeadZone", 0.0, 0.5, 0.01, "Minimum input required before controller responds.", "Higher values prevent stick drift, lower values more responsive"),
+        ("toggle", "Controller Vibration", "GstInput.ControllerVibration", "Enables controller vibration/haptic feedback.", "Disable to save battery or reduce distraction"),
+        ("combo", "Controller Type", "GstInput.ControllerType", ("Xbox", "PlayStation", "Generic", "Steam Controller"), "Type of controller being used.", "Select your controller type for optimal compatibility"),
+    )),
+    ("♿ Accessibility Settings", (
+        ("toggle", "One-Handed Mode", "GstInput.OneHandedMode", "Optimizes controls for one-handed gameplay.", "Useful for players with limited mobility"),
+        ("toggle", "Auto-Aim Assist", "GstInput.AutoAimAssist", "Provides assistance with aiming for accessibility.", "Helps players with motor difficulties"),
+        ("combo", "Color Blind Support", "GstInput.ColorBlindSupport", ("None", "Protanopia", "Deuteranopia", "Tritanopia"), "Adjusts colors for color blind players.", "Select your type of color blindness for better visibility"),
+        ("toggle", "High Contrast Mode", "GstInput.HighContrastMode", "Increases contrast for better visibility.", "Helpful for players with visual impairments"),
+    )),
+    ("⚙️ Advanced Input Settings", (
+        ("toggle", "Raw Input", "GstInput.RawInput", "Bypasses Windows mouse acceleration for more precise input.", "Recommended for competitive play, provides 1:1 mouse movement"),
+        ("toggle", "Input Lag Reduction", "GstInput.InputLagReduction", "Reduces input lag for more responsive controls.", "May increase CPU usage but improves responsiveness"),
+        ("toggle", "Custom Key Bindings", "GstInput.CustomKeyBindings", "Enables custom key binding configuration.", "Allows you to remap keys for better accessibility"),
+        ("toggle", "Macro Support", "GstInput.MacroSupport", "Enables macro recording and playback.", "Useful for complex key combinations and accessibility"),
+    )),
+)
 
 
 class InputTab(QWidget):
     """Input Settings Tab - Comprehensive interface for all input settings."""
     
+    # Precomputed value-label text per slider range, shared by sliders with the same range
+    _SLIDER_LABEL_LIMIT = 2048
+    _slider_labels = {}
+    
+    _SLIDER_TOOLTIP = "Click to focus, then use scroll wheel to adjust {}"
+    _COMBO_TOOLTIP = "Click to focus, then use scroll wheel to change {}"
+    
     def __init__(self, config_manager):
         super().__init__()
         self.config_manager = config_manager
+        
+        # Slider drags fire many updates; commit only the latest value per key once idle
+        self._pending = {}
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(150)
+        self._commit_timer.timeout.connect(self._flush_pending)
+        
+        # Main window change tracker, resolved once the tab is shown inside it
+        self._track_change = None
+        
         self.setup_ui()
         self.load_settings()
     
     def setup_ui(self):
         """Setup the input settings UI."""
+        # One stylesheet for the whole tab, parsed once and matched by object name
+        self.setStyleSheet(StyleCache.get("input"))
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)  # Better margins
         layout.setSpacing(20)  # Better spacing
         
         # Header with better styling
         header = QLabel("🎮 Input Settings")
-        header.setStyleSheet("""
-            font-size: 28px;
-            font-weight: bold;
-            color: #ffffff;
-            margin-bottom: 16px;
-            padding: 12px 0px;
-        """)
+        header.setObjectName("inputHeader")
         layout.addWidget(header)
         
         # Create scroll area for all settings
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background-color: #333;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #666;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #888;
-            }
-        """)
+        scroll_area.setObjectName("inputScroll")
         
         # Main content widget
         self.content_widget = QWidget()
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setSpacing(12)
         
-        # Create input sections
-        self.create_mouse_section()
-        self.create_keyboard_section()
-        self.create_controller_section()
-        self.create_accessibility_section()
-        self.create_advanced_section()
+        # Input sections are built on first show (see build_sections)
+        self._sections_built = False
         
         # No bottom spacer needed - buttons are truly floating
         
@@ -5864,566 +5955,113 @@ class InputTab(QWidget):
         
         # Status bar
         self.status_label = QLabel("Ready to configure input settings")
-        self.status_label.setStyleSheet("""
-            color: #888;
-            font-size: 12px;
-            padding: 5px;
-        """)
+        self.status_label.setObjectName("inputStatus")
         layout.addWidget(self.status_label)
     
-    def create_mouse_section(self):
-        """Create mouse settings section."""
-        group = QGroupBox("🖱️ Mouse Settings")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                color: #ffffff;
-                border: 2px solid #4a90e2;
-                border-radius: 8px;
-                margin-top: 15px;
-                padding-top: 15px;
-                background-color: #2a2a2a;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 8px 0 8px;
-                font-size: 16px;
-            }
-        """)
-        
-        layout = QGridLayout()
-        layout.setSpacing(8)
-        
-        # Mouse Sensitivity
-        self.mouse_sensitivity = self.create_slider_setting(
-            "Mouse Sensitivity", 
-            "GstInput.MouseSensitivity", 
-            0.0, 5.0, 0.1,
-            "Controls how fast the mouse moves the camera. Higher values = faster movement.",
-            "Recommended: 0.5-1.5 for most players"
-        )
-        layout.addWidget(self.mouse_sensitivity, 0, 0, 1, 2)
-        
-        # Mouse Acceleration
-        self.mouse_acceleration = self.create_toggle_setting(
-            "Mouse Acceleration",
-            "GstInput.MouseAcceleration",
-            "Enables mouse acceleration for smoother movement.",
-            "Disable for consistent mouse movement (recommended for competitive play)"
-        )
-        layout.addWidget(self.mouse_acceleration, 1, 0)
-        
-        # Mouse Smoothing
-        self.mouse_smoothing = self.create_toggle_setting(
-            "Mouse Smoothing",
-            "GstInput.MouseSmoothing",
-            "Reduces mouse jitter and provides smoother movement.",
-            "Enable for smoother gameplay, disable for more responsive input"
-        )
-        layout.addWidget(self.mouse_smoothing, 1, 1)
-        
-        # Mouse Polling Rate
-        self.mouse_polling = self.create_combo_setting(
-            "Mouse Polling Rate",
-            "GstInput.MousePollingRate",
-            ["125 Hz", "250 Hz", "500 Hz", "1000 Hz"],
-            "Higher polling rates provide more responsive mouse input.",
-            "1000 Hz recommended for competitive play"
-        )
-        layout.addWidget(self.mouse_polling, 2, 0)
-        
-        # Mouse DPI
-        self.mouse_dpi = self.create_slider_setting(
-            "Mouse DPI",
-            "GstInput.MouseDPI",
-            400, 16000, 100,
-            "Mouse DPI setting (if supported by your mouse).",
-            "Higher DPI = more sensitive movement"
-        )
-        layout.addWidget(self.mouse_dpi, 2, 1)
-        
-        group.setLayout(layout)
-        self.content_layout.addWidget(group)
-    
-    def create_keyboard_section(self):
-        """Create keyboard settings section."""
-        group = QGroupBox("⌨️ Keyboard Settings")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                color: #ffffff;
-                border: 2px solid #4a90e2;
-                border-radius: 8px;
-                margin-top: 15px;
-                padding-top: 15px;
-                background-color: #2a2a2a;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 8px 0 8px;
-                font-size: 16px;
-            }
-        """)
+    def build_sections(self):
+        """Create the input sections the first time the tab is shown."""
+        if self._sections_built:
+            return
+        self._sections_built = True
         
-        layout = QGridLayout()
-        layout.setSpacing(8)
+        # Read every setting once; the row builders look values up here
+        self._settings_snapshot = self.config_manager.get_all_settings()
         
-        # Key Repeat Rate
-        self.key_repeat_rate = self.create_slider_setting(
-            "Key Repeat Rate",
-            "GstInput.KeyRepeatRate",
-            1.0, 10.0, 0.1,
-            "How fast keys repeat when held down.",
-            "Higher values = faster key repetition"
-        )
-        layout.addWidget(self.key_repeat_rate, 0, 0)
-        
-        # Key Repeat Delay
-        self.key_repeat_delay = self.create_slider_setting(
-            "Key Repeat Delay",
-            "GstInput.KeyRepeatDelay",
-            0.1, 2.0, 0.1,
-            "Delay before key starts repeating.",
-            "Lower values = more responsive key repetition"
-        )
-        layout.addWidget(self.key_repeat_delay, 0, 1)
-        
-        # Keyboard Layout
-        self.keyboard_layout = self.create_combo_setting(
-            "Keyboard Layout",
-            "GstInput.KeyboardLayout",
-            ["QWERTY", "AZERTY", "QWERTZ", "Dvorak"],
-            "Keyboard layout for key bindings.",
-            "Select your regional keyboard layout"
-        )
-        layout.addWidget(self.keyboard_layout, 1, 0)
-        
-        # Sticky Keys
-        self.sticky_keys = self.create_toggle_setting(
-            "Sticky Keys",
-            "GstInput.StickyKeys",
-            "Allows modifier keys to stay active after release.",
-            "Useful for accessibility, disable for normal gaming"
-        )
-        layout.addWidget(self.sticky_keys, 1, 1)
+        # Suspend painting and layout so the sections get a single layout pass
+        self.content_widget.setUpdatesEnabled(False)
+        self.content_widget.hide()
+        self.content_layout.setEnabled(False)
         
-        group.setLayout(layout)
-        self.content_layout.addWidget(group)
-    
-    def create_controller_section(self):
-        """Create controller settings section."""
-        group = QGroupBox("🎮 Controller Settings")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                color: #ffffff;
-                border: 2px solid #4a90e2;
-                border-radius: 8px;
-                margin-top: 15px;
-                padding-top: 15px;
-                background-color: #2a2a2a;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 8px 0 8px;
-                font-size: 16px;
-            }
-        """)
-        
-        layout = QGridLayout()
-        layout.setSpacing(8)
+        for title, settings in INPUT_SECTIONS:
+            self.create_section(title, settings)
         
-        # Controller Sensitivity
-        self.controller_sensitivity = self.create_slider_setting(
-            "Controller Sensitivity",
-            "GstInput.ControllerSensitivity",
-            0.1, 3.0, 0.1,
-            "How fast the controller moves the camera.",
-            "Higher values = faster camera movement"
-        )
-        layout.addWidget(self.controller_sensitivity, 0, 0)
-        
-        # Controller Dead Zone
-        self.controller_deadzone = self.create_slider_setting(
-            "Controller Dead Zone",
-            "GstInput.ControllerDeadZone",
-            0.0, 0.5, 0.01,
-            "Minimum input required before controller responds.",
-            "Higher values prevent stick drift, lower values more responsive"
-        )
-        layout.addWidget(self.controller_deadzone, 0, 1)
-        
-        # Controller Vibration
-        self.controller_vibration = self.create_toggle_setting(
-            "Controller Vibration",
-            "GstInput.ControllerVibration",
-            "Enables controller vibration/haptic feedback.",
-            "Disable to save battery or reduce distraction"
-        )
-        layout.addWidget(self.controller_vibration, 1, 0)
-        
-        # Controller Type
-        self.controller_type = self.create_combo_setting(
-            "Controller Type",
-            "GstInput.ControllerType",
-            ["Xbox", "PlayStation", "Generic", "Steam Controller"],
-            "Type of controller being used.",
-            "Select your controller type for optimal compatibility"
-        )
-        layout.addWidget(self.controller_type, 1, 1)
-        
-        group.setLayout(layout)
-        self.content_layout.addWidget(group)
+        # Polish the finished subtree in one pass before it is shown
+        self.content_layout.setEnabled(True)
+        self.content_widget.ensurePolished()
+        self.content_widget.show()
+        self.content_widget.setUpdatesEnabled(True)
     
-    def create_accessibility_section(self):
-        """Create accessibility settings section."""
-        group = QGroupBox("♿ Accessibility Settings")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                color: #ffffff;
-                border: 2px solid #4a90e2;
-                border-radius: 8px;
-                margin-top: 15px;
-                padding-top: 15px;
-                background-color: #2a2a2a;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 8px 0 8px;
-                font-size: 16px;
-            }
-        """)
+    def create_section(self, title, settings):
+        """Create a settings group from its INPUT_SECTIONS entry."""
+        group = QGroupBox(title)
+        group.setObjectName("inputSection")
         
-        layout = QGridLayout()
+        layout = QFormLayout()
         layout.setSpacing(8)
         
-        # One-Handed Mode
-        self.one_handed_mode = self.create_toggle_setting(
-            "One-Handed Mode",
-            "GstInput.OneHandedMode",
-            "Optimizes controls for one-handed gameplay.",
-            "Useful for players with limited mobility"
-        )
-        layout.addWidget(self.one_handed_mode, 0, 0)
-        
-        # Auto-Aim Assist
-        self.auto_aim_assist = self.create_toggle_setting(
-            "Auto-Aim Assist",
-            "GstInput.AutoAimAssist",
-            "Provides assistance with aiming for accessibility.",
-            "Helps players with motor difficulties"
-        )
-        layout.addWidget(self.auto_aim_assist, 0, 1)
-        
-        # Color Blind Support
-        self.color_blind_support = self.create_combo_setting(
-            "Color Blind Support",
-            "GstInput.ColorBlindSupport",
-            ["None", "Protanopia", "Deuteranopia", "Tritanopia"],
-            "Adjusts colors for color blind players.",
-            "Select your type of color blindness for better visibility"
-        )
-        layout.addWidget(self.color_blind_support, 1, 0)
-        
-        # High Contrast Mode
-        self.high_contrast = self.create_toggle_setting(
-            "High Contrast Mode",
-            "GstInput.HighContrastMode",
-            "Increases contrast for better visibility.",
-            "Helpful for players with visual impairments"
-        )
-        layout.addWidget(self.high_contrast, 1, 1)
+        builders = {
+            "slider": self.create_slider_setting,
+            "toggle": self.create_toggle_setting,
+            "combo": self.create_combo_setting,
+        }
+        for kind, *args in settings:
+            layout.addRow(*builders[kind](*args))
         
         group.setLayout(layout)
         self.content_layout.addWidget(group)
     
-    def create_advanced_section(self):
-        """Create advanced input settings section."""
-        group = QGroupBox("⚙️ Advanced Input Settings")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                color: #ffffff;
-                border: 2px solid #4a90e2;
-                border-radius: 8px;
-                margin-top: 15px;
-                padding-top: 15px;
-                background-color: #2a2a2a;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 8px 0 8px;
-                font-size: 16px;
-            }
-        """)
-        
-        layout = QGridLayout()
-        layout.setSpacing(8)
-        
-        # Raw Input
-        self.raw_input = self.create_toggle_setting(
-            "Raw Input",
-            "GstInput.RawInput",
-            "Bypasses Windows mouse acceleration for more precise input.",
-            "Recommended for competitive play, provides 1:1 mouse movement"
-        )
-        layout.addWidget(self.raw_input, 0, 0)
-        
-        # Input Lag Reduction
-        self.input_lag_reduction = self.create_toggle_setting(
-            "Input Lag Reduction",
-            "GstInput.InputLagReduction",
-            "Reduces input lag for more responsive controls.",
-            "May increase CPU usage but improves responsiveness"
-        )
-        layout.addWidget(self.input_lag_reduction, 0, 1)
-        
-        # Custom Key Bindings
-        self.custom_keybindings = self.create_toggle_setting(
-            "Custom Key Bindings",
-            "GstInput.CustomKeyBindings",
-            "Enables custom key binding configuration.",
-            "Allows you to remap keys for better accessibility"
-        )
-        layout.addWidget(self.custom_keybindings, 1, 0)
-        
-        # Macro Support
-        self.macro_support = self.create_toggle_setting(
-            "Macro Support",
-            "GstInput.MacroSupport",
-            "Enables macro recording and playback.",
-            "Useful for complex key combinations and accessibility"
-        )
-        layout.addWidget(self.macro_support, 1, 1)
+    def create_info_label(self, name, description, recommendation=""):
+        """Create the single label holding a setting's name, description and tip."""
+        text = f"<b>{name}</b><br><span style='color: #cccccc; font-size: 12px;'>{description}</span>"
+        if recommendation:
+            text += f"<br><span style='color: #4a90e2; font-size: 11px; font-style: italic;'>💡 {recommendation}</span>"
         
-        group.setLayout(layout)
-        self.content_layout.addWidget(group)
+        label = QLabel(text)
+        label.setObjectName("inputName")
+        label.setWordWrap(True)
+        return label
     
     def create_slider_setting(self, name, key, min_val, max_val, step, description, recommendation=""):
-        """Create a slider setting widget."""
-        widget = QWidget()
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: #333;
-                border-radius: 6px;
-                padding: 10px;
-                margin: 2px;
-            }
-        """)
-        
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(10, 10, 10, 10)
-        
-        # Name and description
-        name_label = QLabel(name)
-        name_label.setStyleSheet("""
-            font-weight: bold;
-            color: #ffffff;
-            font-size: 14px;
-        """)
-        layout.addWidget(name_label)
-        
-        desc_label = QLabel(description)
-        desc_label.setStyleSheet("""
-            color: #cccccc;
-            font-size: 12px;
-        """)
-        desc_label.setWordWrap(True)
-        layout.addWidget(desc_label)
-        
-        if recommendation:
-            rec_label = QLabel(f"💡 {recommendation}")
-            rec_label.setStyleSheet("""
-                color: #4a90e2;
-                font-size: 11px;
-                font-style: italic;
-            """)
-            layout.addWidget(rec_label)
-        
-        # Slider and value
-        slider_layout = QHBoxLayout()
-        
+        """Create a slider setting as a (label, field) form row."""
         slider = FocusAwareSlider(Qt.Orientation.Horizontal)
         slider.setRange(int(min_val * 100), int(max_val * 100))
         
         # Block signals during initialization
         slider.blockSignals(True)
-        slider.setValue(int(self.config_manager.get_setting(key, min_val) * 100))
+        slider.setValue(int(self._settings_snapshot.get(key, min_val) * 100))
         slider.blockSignals(False)
-        slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background: #555;
-                height: 6px;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #4a90e2;
-                width: 18px;
-                height: 18px;
-                border-radius: 9px;
-                margin: -6px 0;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #357abd;
-            }
-        """)
+        slider.setObjectName("inputSlider")
         
-        value_label = QLabel(f"{slider.value() / 100:.2f}")
-        value_label.setStyleSheet("""
-            color: #ffffff;
-            font-weight: bold;
-            min-width: 60px;
-        """)
+        minimum = slider.minimum()
+        labels = self._get_slider_labels(minimum, slider.maximum())
+        
+        value_label = QLabel(self._format_slider_value(slider.value(), labels, minimum))
+        value_label.setObjectName("inputValue")
         
-        slider.valueChanged.connect(lambda v: value_label.setText(f"{v / 100:.2f}"))
-        slider.valueChanged.connect(lambda v: self.update_setting(key, v / 100))
+        slider.valueChanged.connect(partial(self._on_slider_changed, key, value_label, labels, minimum))
         
         # Add helpful tooltip
-        slider.setToolTip(f"Click to focus, then use scroll wheel to adjust {name}")
+        slider.setToolTip(self._SLIDER_TOOLTIP.format(name))
         
+        slider_layout = QHBoxLayout()
         slider_layout.addWidget(slider)
         slider_layout.addWidget(value_label)
-        layout.addLayout(slider_layout)
         
-        return widget
+        return self.create_info_label(name, description, recommendation), slider_layout
     
     def create_toggle_setting(self, name, key, description, recommendation=""):
-        """Create a toggle setting widget."""
-        widget = QWidget()
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: #333;
-                border-radius: 6px;
-                padding: 10px;
-                margin: 2px;
-            }
-        """)
-        
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(10, 10, 10, 10)
-        
-        # Info section
-        info_layout = QVBoxLayout()
-        
-        name_label = QLabel(name)
-        name_label.setStyleSheet("""
-            font-weight: bold;
-            color: #ffffff;
-            font-size: 14px;
-        """)
-        info_layout.addWidget(name_label)
-        
-        desc_label = QLabel(description)
-        desc_label.setStyleSheet("""
-            color: #cccccc;
-            font-size: 12px;
-        """)
-        desc_label.setWordWrap(True)
-        info_layout.addWidget(desc_label)
-        
-        if recommendation:
-            rec_label = QLabel(f"💡 {recommendation}")
-            rec_label.setStyleSheet("""
-                color: #4a90e2;
-                font-size: 11px;
-                font-style: italic;
-            """)
-            info_layout.addWidget(rec_label)
-        
-        layout.addLayout(info_layout)
-        layout.addStretch()
-        
-        # Toggle switch
+        """Create a toggle setting as a (label, field) form row."""
         toggle = ProfessionalToggleSwitch()
         
         # Block signals during initialization
         toggle.blockSignals(True)
-        toggle.set_checked(bool(self.config_manager.get_setting(key, False)))
+        toggle.set_checked(bool(self._settings_snapshot.get(key, False)))
         toggle.blockSignals(False)
         
         # Connect signal AFTER initialization
-        toggle.toggled.connect(lambda checked: self.update_setting(key, int(checked)))
-        
-        layout.addWidget(toggle)
+        toggle.toggled.connect(partial(self._on_toggle_changed, key))
         
-        return widget
+        return self.create_info_label(name, description, recommendation), toggle
     
     def create_combo_setting(self, name, key, options, description, recommendation=""):
-        """Create a combo box setting widget."""
-        widget = QWidget()
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: #333;
-                border-radius: 6px;
-                padding: 10px;
-                margin: 2px;
-            }
-        """)
-        
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(10, 10, 10, 10)
-        
-        # Name and description
-        name_label = QLabel(name)
-        name_label.setStyleSheet("""
-            font-weight: bold;
-            color: #ffffff;
-            font-size: 14px;
-        """)
-        layout.addWidget(name_label)
-        
-        desc_label = QLabel(description)
-        desc_label.setStyleSheet("""
-            color: #cccccc;
-            font-size: 12px;
-        """)
-        desc_label.setWordWrap(True)
-        layout.addWidget(desc_label)
-        
-        if recommendation:
-            rec_label = QLabel(f"💡 {recommendation}")
-            rec_label.setStyleSheet("""
-                color: #4a90e2;
-                font-size: 11px;
-                font-style: italic;
-            """)
-            layout.addWidget(rec_label)
-        
-        # Combo box
+        """Create a combo box setting as a (label, field) form row."""
         combo = FocusAwareComboBox()
         combo.addItems(options)
-        combo.setStyleSheet("""
-            QComboBox {
-                background-color: #444;
-                color: white;
-                border: 1px solid #666;
-                padding: 5px;
-                border-radius: 4px;
-                min-width: 120px;
-            }
-            QComboBox:focus {
-                border-color: #4a90e2;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #888;
-            }
-        """)
+        combo.setObjectName("inputCombo")
         
         # Block signals during initialization
         combo.blockSignals(True)
-        current_value = self.config_manager.get_setting(key, options[0])
+        current_value = self._settings_snapshot.get(key, options[0])
         if current_value in options:
             combo.setCurrentText(current_value)
         else:
@@ -6431,19 +6069,46 @@ class InputTab(QWidget):
         combo.blockSignals(False)
         
         # Connect signal AFTER initialization
-        combo.currentTextChanged.connect(lambda text: self.update_setting(key, text))
+        combo.currentTextChanged.connect(partial(self.update_setting, key))
         
         # Add helpful tooltip
-        combo.setToolTip(f"Click to focus, then use scroll wheel to change {name}")
-        
-        layout.addWidget(combo)
+        combo.setToolTip(self._COMBO_TOOLTIP.format(name))
         
-        return widget
+        return self.create_info_label(name, description, recommendation), combo
+    
+    @classmethod
+    def _get_slider_labels(cls, minimum, maximum):
+        """Return the display strings for a slider range, or None if the range is too large."""
+        if maximum - minimum > cls._SLIDER_LABEL_LIMIT:
+            return None
+        labels = cls._slider_labels.get((minimum, maximum))
+        if labels is None:
+            labels = tuple(f"{i / 100:.2f}" for i in range(minimum, maximum + 1))
+            cls._slider_labels[(minimum, maximum)] = labels
+        return labels
+    
+    @staticmethod
+    def _format_slider_value(value, labels, minimum):
+        """Format a scaled slider value, using the precomputed table when there is one."""
+        if labels is not None:
+            return labels[value - minimum]
+        return f"{value / 100:.2f}"
+    
+    def _on_slider_changed(self, key, value_label, labels, minimum, value):
+        """Show and store a slider's scaled value."""
+        value_label.setText(self._format_slider_value(value, labels, minimum))
+        self.update_setting(key, value / 100)
+    
+    def _on_toggle_changed(self, key, checked):
+        """Store a toggle's state as 0/1."""
+        self.update_setting(key, int(checked))
     
     def showEvent(self, event):
-        """Refresh settings when tab becomes visible."""
+        """Build sections and resolve the change tracker on first show."""
         super().showEvent(event)
-        self.load_settings()
+        if not self._sections_built:
+            self._track_change = getattr(self.window(), 'track_setting_change', None)
+            self.build_sections()
     
     def load_settings(self):
         """Load current settings from config."""
@@ -6451,24 +6116,35 @@ class InputTab(QWidget):
         pass
     
     def update_setting(self, key, value):
-        """Update a setting value and track changes."""
-        try:
-            # Get the old value for tracking
-            old_value = self.config_manager.get_setting(key)
-            
-            # Update the setting
-            self.config_manager.set_setting(key, value)
-            
-            # Track the change in the main window
-            if hasattr(self.parent(), 'track_setting_change'):
-                self.parent().track_setting_change(key, old_value, value)
-            
-            self.status_label.setText(f"Updated {key} = {value}")
-            log_info(f"Input setting updated: {key} = {value}", "INPUT")
-        except Exception as e:
-            log_error(f"Failed to update input setting {key}: {str(e)}", "INPUT", e)
-            self.status_label.setText(f"Error updating {key}")
-
+        """Queue a setting value; it is committed once input goes idle."""
+        self._pending[key] = value
+        self._commit_timer.start()
+    
+    def save_settings(self):
+        """Commit any queued setting changes immediately."""
+        self._commit_timer.stop()
+        self._flush_pending()
+    
+    def _flush_pending(self):
+        """Write queued setting values to the config and track the changes."""
+        pending, self._pending = self._pending, {}
+        for key, value in pending.items():
+            try:
+                # Get the old value for tracking, only if something consumes it
+                old_value = self.config_manager.get_setting(key) if self._track_change else None
+                
+                # Update the setting
+                self.config_manager.set_setting(key, value)
+                
+                # Track the change in the main window
+                if self._track_change:
+                    self._track_change(key, old_value, value)
+                
+                self.status_label.setText(f"Updated {key} = {value}")
+                log_info(f"Input setting updated: {key} = {value}", "INPUT")
+            except Exception as e:
+                log_error(f"Failed to update input setting {key}: {str(e)}", "INPUT", e)
+                self.status_label.setText(f"Error updating {key}")
 
 def main():
     """Main application entry point."""
@@ -6478,12 +6154,7 @@ def main():
         app.setApplicationName("FieldTuner")
         app.setApplicationVersion("2.0.0")
         
-        # Enable high DPI scaling
-        try:
-            app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
-            app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
-        except AttributeError:
-            pass
+        # High DPI scaling is always enabled in Qt 6
         
         window = MainWindow()
         window.show()
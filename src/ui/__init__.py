@@ -1,41 +1,47 @@
 """
 FieldTuner V2.0 - UI Module
 Contains all user interface components and widgets.
+
+Names are imported lazily on first access. Tab classes are not re-exported;
+MainWindow imports each tab module where it builds the tabs.
 """
 
-from .components.custom_widgets import (
-    FocusAwareSlider,
-    FocusAwareSpinBox, 
-    FocusAwareComboBox,
-    ProfessionalToggleSwitch,
-    PresetCard,
-    LoadingOverlay
-)
-from .main_window import MainWindow
-from .tabs.quick_settings import QuickSettingsTab
-from .tabs.graphics import GraphicsTab
-from .tabs.input import InputTab
-from .tabs.advanced import AdvancedTab
-from .tabs.backup import BackupTab
-from .tabs.code_view import CodeViewTab
-from .tabs.debug import DebugTab
+import importlib
+import sys
+
+
+def _lazy_exports(module_name, mapping):
+    """
+    Build the module __getattr__ and __dir__ for a package whose public names
+    (mapping of name -> defining submodule) are imported on first access.
+    """
+    module = sys.modules[module_name]
+    
+    def __getattr__(name):
+        if name not in mapping:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(mapping[name], module_name), name)
+        setattr(module, name, value)
+        return value
+    
+    def __dir__():
+        return sorted(set(vars(module)) | set(mapping))
+    
+    return __getattr__, __dir__
 
-__all__ = [
+
+# Public name -> submodule that defines it
+_LAZY = {
     # Custom Widgets
-    'FocusAwareSlider',
-    'FocusAwareSpinBox',
-    'FocusAwareComboBox', 
-    'ProfessionalToggleSwitch',
-    'PresetCard',
-    'LoadingOverlay',
+    'FocusAwareSlider': '.components.custom_widgets',
+    'FocusAwareSpinBox': '.components.custom_widgets',
+    'FocusAwareComboBox': '.components.custom_widgets',
+    'ProfessionalToggleSwitch': '.components.custom_widgets',
+    'PresetCard': '.components.custom_widgets',
+    'LoadingOverlay': '.components.custom_widgets',
     # Main Window
-    'MainWindow',
-    # Tabs
-    'QuickSettingsTab',
-    'GraphicsTab',
-    'InputTab',
-    'AdvancedTab',
-    'BackupTab',
-    'CodeViewTab',
-    'DebugTab'
-]
+    'MainWindow': '.main_window',
+}
+
+__all__ = list(_LAZY)
+__getattr__, __dir__ = _lazy_exports(__name__, _LAZY)
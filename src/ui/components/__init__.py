@@ -1,22 +1,21 @@
 """
 FieldTuner V2.0 - UI Components
 Contains custom widgets and UI components.
+
+Widgets are imported lazily on first access.
 """
 
-from .custom_widgets import (
-    FocusAwareSlider,
-    FocusAwareSpinBox,
-    FocusAwareComboBox,
-    ProfessionalToggleSwitch,
-    PresetCard,
-    LoadingOverlay
-)
+from .. import _lazy_exports
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'FocusAwareSlider': '.custom_widgets',
+    'FocusAwareSpinBox': '.custom_widgets',
+    'FocusAwareComboBox': '.custom_widgets',
+    'ProfessionalToggleSwitch': '.custom_widgets',
+    'PresetCard': '.custom_widgets',
+    'LoadingOverlay': '.custom_widgets',
+}
 
-__all__ = [
-    'FocusAwareSlider',
-    'FocusAwareSpinBox', 
-    'FocusAwareComboBox',
-    'ProfessionalToggleSwitch',
-    'PresetCard',
-    'LoadingOverlay'
-]
+__all__ = list(_LAZY)
+__getattr__, __dir__ = _lazy_exports(__name__, _LAZY)
@@ -5,57 +5,250 @@ Modern, accessible custom widgets with consistent theming and improved UX.
 
 from PyQt6.QtWidgets import (
     QWidget, QSlider, QDoubleSpinBox, QComboBox, QLabel, QPushButton, 
-    QVBoxLayout, QHBoxLayout, QProgressBar, QFrame
+    QVBoxLayout, QHBoxLayout, QFrame, QApplication, QSizePolicy,
+    QProxyStyle, QStyle
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRect
-from PyQt6.QtGui import QPainter, QColor, QFont, QLinearGradient, QBrush, QPalette
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QRect, QRectF, QElapsedTimer, QPointF
+from PyQt6.QtGui import QPainter, QColor, QFont, QLinearGradient, QBrush, QPalette, QPixmap, QPixmapCache, QPen
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from dataclasses import dataclass
+from typing import Optional
 
 from debug import log_info, log_error, log_warning
 from ui.theme import theme_manager
 
 
-class FocusAwareSlider(QSlider):
-    """Enhanced slider that only responds to scroll wheel when focused."""
-    
-    def __init__(self, orientation=Qt.Orientation.Horizontal):
-        super().__init__(orientation)
+# QColors resolved from the current theme, dropped whenever the theme changes
+_qcolor_cache = {}
+
+
+def _theme_qcolor(name):
+    """Get a theme color as a QColor, parsing the color string only once per theme."""
+    color = _qcolor_cache.get(name)
+    if color is None:
+        color = _qcolor_cache[name] = QColor(theme_manager.get_color(name))
+    return color
+
+
+def _preset_icon_pixmap(icon, color, radius, dpr):
+    """
+    Get the rasterized tile for a preset icon, shared through QPixmapCache.
+    
+    The tile is the emoji on a faint rounded background, sized to fill the
+    inside of the icon label's 1px card border.
+    """
+    key = f"fieldtuner_preset_icon_{icon}_{color}_{radius}_{dpr}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(round(46 * dpr), round(46 * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        font = QFont()
+        font.setPixelSize(32)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(255, 255, 255, 26))
+        painter.drawRoundedRect(QRectF(0, 0, 46, 46), radius, radius)
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(0, 0, 46, 46, Qt.AlignmentFlag.AlignCenter, icon)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+# FocusAware* stylesheets keyed by their builder, so classes using the same
+# builder (the spin box and combo box share the input style) get one string
+_focus_style_cache = {}
+
+
+class _ThemedSliderStyle(QProxyStyle):
+    """
+    Draws FocusAwareSlider's groove and handle with QPainter.
+    
+    Stylesheet sliders position the round handle with negative margins,
+    which sends every repaint through the stylesheet engine. This style
+    paints the same look directly from the cached theme colors.
+    """
+    
+    GROOVE_HEIGHT = 6
+    HANDLE_SIZE = 20
+    
+    def pixelMetric(self, metric, option=None, widget=None):
+        """Size the handle and the slider track for the round handle."""
+        if metric in (QStyle.PixelMetric.PM_SliderLength,
+                      QStyle.PixelMetric.PM_SliderThickness,
+                      QStyle.PixelMetric.PM_SliderControlThickness):
+            return self.HANDLE_SIZE
+        return super().pixelMetric(metric, option, widget)
+    
+    def subControlRect(self, control, option, sub_control, widget=None):
+        """Lay the handle out along the whole track for horizontal sliders."""
+        if (control == QStyle.ComplexControl.CC_Slider
+                and option.orientation == Qt.Orientation.Horizontal):
+            rect = option.rect
+            if sub_control == QStyle.SubControl.SC_SliderGroove:
+                return QRect(rect)
+            if sub_control != QStyle.SubControl.SC_SliderHandle:
+                return super().subControlRect(control, option, sub_control, widget)
+            span = rect.width() - self.HANDLE_SIZE
+            pos = QStyle.sliderPositionFromValue(
+                option.minimum, option.maximum, option.sliderPosition, span, option.upsideDown)
+            return QRect(rect.x() + pos, rect.center().y() - self.HANDLE_SIZE // 2 + 1,
+                         self.HANDLE_SIZE, self.HANDLE_SIZE)
+        return super().subControlRect(control, option, sub_control, widget)
+    
+    def drawComplexControl(self, control, option, painter, widget=None):
+        """Paint horizontal sliders; anything else goes to the base style."""
+        if control != QStyle.ComplexControl.CC_Slider or option.orientation != Qt.Orientation.Horizontal:
+            super().drawComplexControl(control, option, painter, widget)
+            return
+        
+        handle = self.subControlRect(control, option, QStyle.SubControl.SC_SliderHandle, widget)
+        rect = option.rect
+        radius = self.GROOVE_HEIGHT / 2
+        groove = QRectF(rect.x() + self.HANDLE_SIZE / 2, rect.center().y() - radius + 1,
+                        max(0, rect.width() - self.HANDLE_SIZE), self.GROOVE_HEIGHT)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        
+        # Groove, then the filled part up to the handle centre
+        painter.setBrush(_theme_qcolor('bg_tertiary'))
+        painter.drawRoundedRect(groove, radius, radius)
+        filled = QRectF(groove)
+        filled.setRight(handle.center().x())
+        painter.setBrush(_theme_qcolor('primary'))
+        painter.drawRoundedRect(filled, radius, radius)
+        
+        # Handle: state color with a border that turns into the focus ring
+        state = option.state
+        if state & QStyle.StateFlag.State_Sunken:
+            fill = _theme_qcolor('primary_pressed')
+        elif (state & QStyle.StateFlag.State_MouseOver
+              and option.activeSubControls & QStyle.SubControl.SC_SliderHandle):
+            fill = _theme_qcolor('primary_hover')
+        else:
+            fill = _theme_qcolor('primary')
+        if state & QStyle.StateFlag.State_HasFocus:
+            border, width = _theme_qcolor('border_focus'), 3
+        else:
+            border, width = _theme_qcolor('bg_primary'), 2
+        painter.setPen(QPen(border, width))
+        painter.setBrush(fill)
+        painter.drawEllipse(QRectF(handle).adjusted(width / 2, width / 2, -width / 2, -width / 2))
+        painter.restore()
+
+
+# Shared by every FocusAwareSlider; created once a QApplication exists
+_themed_slider_style = None
+
+
+# Preset card stylesheets per (color, darker) pair. Cards sharing a preset
+# reuse the same strings; the cache is dropped whenever the theme changes.
+_card_style_cache = {}
+
+
+def _preset_card_styles(color, darker):
+    """Get the stylesheets for a preset card drawn in the given colors."""
+    styles = _card_style_cache.get((color, darker))
+    if styles is None:
+        styles = _card_style_cache[(color, darker)] = {
+            'title': f"""
+                font-size: {theme_manager.get_font('secondary_size')};
+                font-weight: bold;
+                color: {theme_manager.get_color('text_primary')};
+            """,
+            'desc': f"""
+                font-size: {theme_manager.get_font('small_size')};
+                color: {theme_manager.get_color('text_secondary')};
+                line-height: 1.3;
+            """,
+            'perf_label': f"""
+                font-size: {theme_manager.get_font('small_size')};
+                color: {theme_manager.get_color('text_tertiary')};
+                font-weight: 500;
+            """,
+            'apply_btn': f"""
+                QPushButton {{
+                    background-color: {color};
+                    color: {theme_manager.get_color('text_primary')};
+                    border: none;
+                    border-radius: {theme_manager.get_border_radius('md')};
+                    font-weight: bold;
+                    font-size: {theme_manager.get_font('secondary_size')};
+                }}
+                QPushButton:hover {{
+                    background-color: {darker};
+                }}
+                QPushButton:pressed {{
+                    background-color: {theme_manager.get_color('primary_pressed')};
+                }}
+            """,
+            # Both card states in one sheet, switched by the "selected" property
+            'card': f"""
+                QWidget {{
+                    background-color: {theme_manager.get_color('bg_card')};
+                    border: 1px solid {theme_manager.get_color('border_primary')};
+                    border-radius: {theme_manager.get_border_radius('lg')};
+                }}
+                QWidget:hover {{
+                    background-color: {theme_manager.get_color('bg_tertiary')};
+                    border: 2px solid {color};
+                }}
+                QWidget[selected="true"], QWidget[selected="true"] QWidget {{
+                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                        stop:0 #1a3a5c, stop:1 #0f2a4a);
+                    border: 2px solid {color};
+                    border-radius: {theme_manager.get_border_radius('lg')};
+                }}
+            """,
+        }
+    return styles
+
+
+def _clear_theme_caches(_theme):
+    """Drop every value resolved from the previous theme."""
+    _qcolor_cache.clear()
+    _card_style_cache.clear()
+    _focus_style_cache.clear()
+
+
+theme_manager.theme_changed.connect(_clear_theme_caches)
+
+
+class _FocusScrollMixin:
+    """
+    Input widget behaviour shared by the FocusAware* classes.
+    
+    The scroll wheel only changes the value while the widget has focus, so
+    scrolling a page never nudges a setting by accident. Every class using
+    the same stylesheet builder shares one string, built on first use per
+    theme.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self._scroll_enabled = False
         self._setup_style()
-        
+    
+    @staticmethod
+    def _build_style_sheet():
+        """Build the stylesheet for this widget class."""
+        return theme_manager.get_input_style()
+    
     def _setup_style(self):
-        """Setup the slider styling using theme manager."""
-        self.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                background: {theme_manager.get_color('bg_tertiary')};
-                height: 6px;
-                border-radius: 3px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {theme_manager.get_color('primary')};
-                width: 20px;
-                height: 20px;
-                border-radius: 10px;
-                margin: -7px 0;
-                border: 2px solid {theme_manager.get_color('bg_primary')};
-            }}
-            QSlider::handle:horizontal:hover {{
-                background: {theme_manager.get_color('primary_hover')};
-            }}
-            QSlider::handle:horizontal:pressed {{
-                background: {theme_manager.get_color('primary_pressed')};
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {theme_manager.get_color('primary')};
-                border-radius: 3px;
-            }}
-        """)
-        
+        """Apply the class's shared stylesheet."""
+        build = type(self)._build_style_sheet
+        sheet = _focus_style_cache.get(build)
+        if sheet is None:
+            sheet = _focus_style_cache[build] = build()
+        self.setStyleSheet(sheet)
+    
     def wheelEvent(self, event):
-        """Only respond to scroll wheel when the slider is focused."""
+        """Only respond to scroll wheel when the widget is focused."""
         if self._scroll_enabled and self.hasFocus():
             super().wheelEvent(event)
     
@@ -63,79 +256,69 @@ class FocusAwareSlider(QSlider):
         """Enable scroll wheel when focused."""
         super().focusInEvent(event)
         self._scroll_enabled = True
-        # Add focus indicator
-        self.setStyleSheet(self.styleSheet() + f"""
-            QSlider::handle:horizontal {{
-                border: 3px solid {theme_manager.get_color('border_focus')};
-            }}
-        """)
     
     def focusOutEvent(self, event):
         """Disable scroll wheel when not focused."""
         super().focusOutEvent(event)
         self._scroll_enabled = False
-        # Remove focus indicator
-        self.setStyleSheet(self.styleSheet().replace(f"""
-            QSlider::handle:horizontal {{
-                border: 3px solid {theme_manager.get_color('border_focus')};
-            }}
-        """, ""))
 
 
-class FocusAwareSpinBox(QDoubleSpinBox):
-    """Enhanced spinbox that only responds to scroll wheel when focused."""
+class FocusAwareSlider(_FocusScrollMixin, QSlider):
+    """Enhanced slider that only responds to scroll wheel when focused."""
+    
+    WHEEL_INTERVAL_MS = 33  # Apply accumulated wheel movement at most ~30 times a second
+    
+    def __init__(self, orientation=Qt.Orientation.Horizontal):
+        super().__init__(orientation)
+        self._wheel_delta = 0
+        self._wheel_timer = None
     
-    def __init__(self):
-        super().__init__()
-        self._scroll_enabled = False
-        self._setup_style()
-        
     def _setup_style(self):
-        """Setup the spinbox styling using theme manager."""
-        self.setStyleSheet(theme_manager.get_input_style())
-        
+        """Paint through the shared themed style instead of a stylesheet."""
+        global _themed_slider_style
+        if _themed_slider_style is None:
+            _themed_slider_style = _ThemedSliderStyle()
+        self.setStyle(_themed_slider_style)
+        # Needed for the handle hover color
+        self.setAttribute(Qt.WidgetAttribute.WA_Hover)
+    
     def wheelEvent(self, event):
-        """Only respond to scroll wheel when the spinbox is focused."""
+        """Only respond to scroll wheel when the slider is focused."""
         if self._scroll_enabled and self.hasFocus():
-            super().wheelEvent(event)
-    
-    def focusInEvent(self, event):
-        """Enable scroll wheel when focused."""
-        super().focusInEvent(event)
-        self._scroll_enabled = True
+            # Accumulate ticks and apply them together, so a fast trackpad
+            # scroll emits valueChanged a few times instead of per tick
+            self._wheel_delta += event.angleDelta().y()
+            if self._wheel_timer is None:
+                self._wheel_timer = QTimer(self)
+                self._wheel_timer.setSingleShot(True)
+                self._wheel_timer.setInterval(self.WHEEL_INTERVAL_MS)
+                self._wheel_timer.timeout.connect(self._apply_wheel_delta)
+            if not self._wheel_timer.isActive():
+                self._wheel_timer.start()
+            event.accept()
+    
+    def _apply_wheel_delta(self):
+        """Move the slider by the wheel movement accumulated since the last update."""
+        # Same step size as QAbstractSlider uses for one wheel notch
+        step = max(1, min(QApplication.wheelScrollLines() * self.singleStep(), self.pageStep()))
+        steps = int(self._wheel_delta * step / 120)
+        if steps:
+            # Keep the remainder so slow trackpad movement still adds up
+            self._wheel_delta -= steps * 120 / step
+            self.setValue(self.value() + steps)
     
     def focusOutEvent(self, event):
-        """Disable scroll wheel when not focused."""
+        """Disable scroll wheel and drop pending wheel movement when not focused."""
         super().focusOutEvent(event)
-        self._scroll_enabled = False
+        self._wheel_delta = 0
 
 
-class FocusAwareComboBox(QComboBox):
+class FocusAwareSpinBox(_FocusScrollMixin, QDoubleSpinBox):
+    """Enhanced spinbox that only responds to scroll wheel when focused."""
+
+
+class FocusAwareComboBox(_FocusScrollMixin, QComboBox):
     """Enhanced combobox that only responds to scroll wheel when focused."""
-    
-    def __init__(self):
-        super().__init__()
-        self._scroll_enabled = False
-        self._setup_style()
-        
-    def _setup_style(self):
-        """Setup the combobox styling using theme manager."""
-        self.setStyleSheet(theme_manager.get_input_style())
-        
-    def wheelEvent(self, event):
-        """Only respond to scroll wheel when the combobox is focused."""
-        if self._scroll_enabled and self.hasFocus():
-            super().wheelEvent(event)
-    
-    def focusInEvent(self, event):
-        """Enable scroll wheel when focused."""
-        super().focusInEvent(event)
-        self._scroll_enabled = True
-    
-    def focusOutEvent(self, event):
-        """Disable scroll wheel when not focused."""
-        super().focusOutEvent(event)
-        self._scroll_enabled = False
 
 
 class ProfessionalToggleSwitch(QWidget):
@@ -147,11 +330,6 @@ class ProfessionalToggleSwitch(QWidget):
         super().__init__(parent)
         self.setFixedSize(52, 28)
         self.is_on = False
-        self._setup_style()
-        
-    def _setup_style(self):
-        """Setup the toggle switch styling."""
-        self.update_style()
         
     def mousePressEvent(self, event):
         self.toggle()
@@ -159,52 +337,51 @@ class ProfessionalToggleSwitch(QWidget):
     
     def toggle(self):
         self.is_on = not self.is_on
-        self.update_style()
+        self.update()
         self.toggled.emit(self.is_on)
     
     def set_checked(self, checked):
         self.is_on = checked
-        self.update_style()
+        self.update()
     
     def is_checked(self):
         return self.is_on
     
-    def update_style(self):
-        """Update toggle switch styling based on state."""
-        if self.is_on:
-            self.setStyleSheet(f"""
-                QWidget {{
-                    background-color: {theme_manager.get_color('primary')};
-                    border: 2px solid {theme_manager.get_color('primary')};
-                    border-radius: 14px;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QWidget {{
-                    background-color: {theme_manager.get_color('bg_tertiary')};
-                    border: 2px solid {theme_manager.get_color('border_primary')};
-                    border-radius: 14px;
-                }}
-            """)
+    def _track_pixmap(self):
+        """Get the rendered track for the current state, shared through QPixmapCache."""
+        dpr = self.devicePixelRatioF()
+        key = (f"fieldtuner_toggle_{self.is_on}_{theme_manager.get_theme()}_"
+               f"{self.width()}x{self.height()}_{dpr}")
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            if self.is_on:
+                painter.setBrush(_theme_qcolor('primary'))
+                painter.setPen(_theme_qcolor('primary'))
+            else:
+                painter.setBrush(_theme_qcolor('bg_tertiary'))
+                painter.setPen(_theme_qcolor('border_primary'))
+            painter.drawRoundedRect(0, 0, self.width(), self.height(), 14, 14)
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
     
     def paintEvent(self, event):
+        """Draw the track and knob; this is the only styling the switch has."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw background
-        if self.is_on:
-            painter.setBrush(QColor(theme_manager.get_color('primary')))
-            painter.setPen(QColor(theme_manager.get_color('primary')))
-        else:
-            painter.setBrush(QColor(theme_manager.get_color('bg_tertiary')))
-            painter.setPen(QColor(theme_manager.get_color('border_primary')))
-        
-        painter.drawRoundedRect(0, 0, self.width(), self.height(), 14, 14)
+        painter.drawPixmap(0, 0, self._track_pixmap())
         
         # Draw toggle button
-        painter.setBrush(QColor(theme_manager.get_color('text_primary')))
-        painter.setPen(QColor(theme_manager.get_color('text_primary')))
+        text_color = _theme_qcolor('text_primary')
+        painter.setBrush(text_color)
+        painter.setPen(text_color)
         
         if self.is_on:
             button_x = self.width() - 22
@@ -215,23 +392,97 @@ class ProfessionalToggleSwitch(QWidget):
         painter.drawEllipse(button_x, button_y, 20, 20)
 
 
+class _PerfBar(QWidget):
+    """Thin 0-100 bar filled with a gradient, painted without a stylesheet."""
+    
+    def __init__(self, color, darker, value, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(6)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._value = value
+        # Bounding-box mode stretches the gradient over whatever width is filled
+        gradient = QLinearGradient(QPointF(0, 0), QPointF(1, 0))
+        gradient.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
+        gradient.setColorAt(0, QColor(color))
+        gradient.setColorAt(1, QColor(darker))
+        self._brush = QBrush(gradient)
+    
+    def value(self):
+        return self._value
+    
+    def setValue(self, value):
+        self._value = max(0, min(100, value))
+        self.update()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Track
+        painter.setPen(_theme_qcolor('border_primary'))
+        painter.setBrush(_theme_qcolor('bg_tertiary'))
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+        
+        # Filled part
+        width = (self.width() - 2) * self._value / 100
+        if width > 0:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self._brush)
+            painter.drawRoundedRect(QRectF(1, 1, width, self.height() - 2), 2, 2)
+
+
+@dataclass(frozen=True, slots=True)
+class PresetSpec:
+    """Static look of a preset card."""
+    icon: str
+    color_key: str  # Theme color name
+    darker: Optional[str]  # None uses the theme's primary_pressed color
+    description: str
+    performance: int
+
+
+_PRESET_SPECS = {
+    'esports': PresetSpec('🏆', 'accent_gold', '#b8860b', 'Maximum performance for competitive gaming', 95),
+    'competitive': PresetSpec('⚔️', 'accent_red', '#e74c3c', 'High performance with balanced settings', 85),
+    'balanced': PresetSpec('⚖️', 'accent_green', '#26a69a', 'Optimal balance between quality and performance', 70),
+    'quality': PresetSpec('🎨', 'accent_blue', '#2980b9', 'High visual quality with good performance', 45),
+    'performance': PresetSpec('🚀', 'accent_purple', '#7fb069', 'Maximum performance with minimal quality loss', 25),
+}
+_DEFAULT_PRESET_SPEC = PresetSpec('⚙️', 'primary', None, 'Optimized settings for better gaming', 50)
+
+
 class ModernPresetCard(QWidget):
     """Modern, consistent preset card with enhanced UX."""
     
     clicked = pyqtSignal(str)
     hovered = pyqtSignal(str)
     
+    HOVER_THROTTLE_MS = 50  # Minimum gap between hovered emissions
+    
     def __init__(self, preset_key, preset_data, parent=None):
         super().__init__(parent)
         self.preset_key = preset_key
         self.preset_data = preset_data
         self.is_selected = False
+        self._hover_timer = None
+        self._hover_pending = False
+        self._restyle_timer = None
+        self.hover_animation = None  # Created on first hover
+        self._spec = _PRESET_SPECS.get(preset_key, _DEFAULT_PRESET_SPEC)
+        
+        # Resolve the per-preset values once; setup_ui and update_style reuse them
+        self._icon = self._get_preset_icon()
+        self._color = self._get_preset_color()
+        self._darker = self._get_darker_color()
+        self._perf_value = self._get_performance_value()
+        
         self.setFixedSize(280, 180)  # Consistent size
         self.setup_ui()
-        self.setup_animations()
         
     def setup_ui(self):
         """Setup the modern preset card UI."""
+        styles = _preset_card_styles(self._color, self._darker)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
@@ -241,14 +492,10 @@ class ModernPresetCard(QWidget):
         header_layout.setSpacing(12)
         
         # Icon with background
-        icon_label = QLabel(self._get_preset_icon())
-        icon_label.setStyleSheet(f"""
-            font-size: 32px;
-            color: {self._get_preset_color()};
-            background-color: rgba(255, 255, 255, 0.1);
-            border-radius: {theme_manager.get_border_radius('lg')};
-            padding: 8px;
-        """)
+        icon_label = QLabel()
+        # The card's border radius, less the label's own 1px border
+        radius = int(theme_manager.get_border_radius('lg').rstrip('px')) - 1
+        icon_label.setPixmap(_preset_icon_pixmap(self._icon, self._color, radius, icon_label.devicePixelRatioF()))
         icon_label.setFixedSize(48, 48)
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header_layout.addWidget(icon_label)
@@ -258,11 +505,7 @@ class ModernPresetCard(QWidget):
         text_layout.setSpacing(4)
         
         title_label = QLabel(self.preset_data.get('name', 'Unknown'))
-        title_label.setStyleSheet(f"""
-            font-size: {theme_manager.get_font('secondary_size')};
-            font-weight: bold;
-            color: {theme_manager.get_color('text_primary')};
-        """)
+        title_label.setStyleSheet(styles['title'])
         title_label.setWordWrap(True)
         text_layout.addWidget(title_label)
         
@@ -272,11 +515,7 @@ class ModernPresetCard(QWidget):
             desc_text = self._get_default_description()
         
         desc_label = QLabel(desc_text)
-        desc_label.setStyleSheet(f"""
-            font-size: {theme_manager.get_font('small_size')};
-            color: {theme_manager.get_color('text_secondary')};
-            line-height: 1.3;
-        """)
+        desc_label.setStyleSheet(styles['desc'])
         desc_label.setWordWrap(True)
         desc_label.setMaximumHeight(32)
         text_layout.addWidget(desc_label)
@@ -291,30 +530,11 @@ class ModernPresetCard(QWidget):
         perf_layout.setSpacing(8)
         
         perf_label = QLabel("Performance:")
-        perf_label.setStyleSheet(f"""
-            font-size: {theme_manager.get_font('small_size')};
-            color: {theme_manager.get_color('text_tertiary')};
-            font-weight: 500;
-        """)
+        perf_label.setStyleSheet(styles['perf_label'])
         perf_layout.addWidget(perf_label)
         
         # Performance bar
-        self.perf_bar = QProgressBar()
-        self.perf_bar.setFixedHeight(6)
-        self.perf_bar.setRange(0, 100)
-        self.perf_bar.setValue(self._get_performance_value())
-        self.perf_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: {theme_manager.get_color('bg_tertiary')};
-                border: 1px solid {theme_manager.get_color('border_primary')};
-                border-radius: 3px;
-            }}
-            QProgressBar::chunk {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {self._get_preset_color()}, stop:1 {self._get_darker_color()});
-                border-radius: 2px;
-            }}
-        """)
+        self.perf_bar = _PerfBar(self._color, self._darker, self._perf_value)
         perf_layout.addWidget(self.perf_bar)
         
         layout.addLayout(perf_layout)
@@ -325,69 +545,76 @@ class ModernPresetCard(QWidget):
         # Apply button
         apply_btn = QPushButton("Apply Preset")
         apply_btn.setFixedHeight(32)
-        apply_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self._get_preset_color()};
-                color: {theme_manager.get_color('text_primary')};
-                border: none;
-                border-radius: {theme_manager.get_border_radius('md')};
-                font-weight: bold;
-                font-size: {theme_manager.get_font('secondary_size')};
-            }}
-            QPushButton:hover {{
-                background-color: {self._get_darker_color()};
-            }}
-            QPushButton:pressed {{
-                background-color: {theme_manager.get_color('primary_pressed')};
-            }}
-        """)
+        apply_btn.setStyleSheet(styles['apply_btn'])
         apply_btn.clicked.connect(lambda: self.clicked.emit(self.preset_key))
         layout.addWidget(apply_btn)
         
-        # Set card styling
-        self.update_style()
+        # Set card styling once; selection changes only flip the property
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setProperty('selected', False)
+        self.setStyleSheet(styles['card'])
     
     def setup_animations(self):
-        """Setup hover and selection animations."""
+        """Setup hover and selection animations; most cards are never hovered, so this waits for the first one."""
+        if self.hover_animation is not None:
+            return
         self.hover_animation = QPropertyAnimation(self, b"geometry")
         self.hover_animation.setDuration(150)
         self.hover_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
     
     def update_style(self):
-        """Update card styling based on state."""
-        color = self._get_preset_color()
-        if self.is_selected:
-            self.setStyleSheet(f"""
-                QWidget {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #1a3a5c, stop:1 #0f2a4a);
-                    border: 2px solid {color};
-                    border-radius: {theme_manager.get_border_radius('lg')};
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QWidget {{
-                    background-color: {theme_manager.get_color('bg_card')};
-                    border: 1px solid {theme_manager.get_color('border_primary')};
-                    border-radius: {theme_manager.get_border_radius('lg')};
-                }}
-                QWidget:hover {{
-                    background-color: {theme_manager.get_color('bg_tertiary')};
-                    border: 2px solid {color};
-                }}
-            """)
+        """Restyle the card on the next event-loop pass, once per batch of state changes."""
+        if self._restyle_timer is None:
+            self._restyle_timer = QTimer(self)
+            self._restyle_timer.setSingleShot(True)
+            self._restyle_timer.setInterval(0)
+            self._restyle_timer.timeout.connect(self._apply_style_now)
+        if not self._restyle_timer.isActive():
+            self._restyle_timer.start()
+    
+    def _apply_style_now(self):
+        """Repolish the card for the current state, skipping it if nothing changed."""
+        if self.property('selected') == self.is_selected:
+            return
+        self.setProperty('selected', self.is_selected)
+        # The selected rule also matches descendants, so they need a repolish too
+        style = self.style()
+        for widget in (self, *self.findChildren(QWidget)):
+            style.unpolish(widget)
+            style.polish(widget)
+        self.update()
     
     def set_selected(self, selected):
         """Set the selected state of the card."""
+        if selected == self.is_selected:
+            return
         self.is_selected = selected
         self.update_style()
     
     def enterEvent(self, event):
         """Handle mouse enter event."""
-        self.hovered.emit(self.preset_key)
+        self.setup_animations()
+        
+        # Throttle: emit right away, then at most once per HOVER_THROTTLE_MS
+        if self._hover_timer is None:
+            self._hover_timer = QTimer(self)
+            self._hover_timer.setSingleShot(True)
+            self._hover_timer.setInterval(self.HOVER_THROTTLE_MS)
+            self._hover_timer.timeout.connect(self._flush_hover)
+        if self._hover_timer.isActive():
+            self._hover_pending = True
+        else:
+            self.hovered.emit(self.preset_key)
+            self._hover_timer.start()
         super().enterEvent(event)
     
+    def _flush_hover(self):
+        """Emit the hover that arrived while throttled."""
+        if self._hover_pending:
+            self._hover_pending = False
+            self.hovered.emit(self.preset_key)
+            self._hover_timer.start()
+    
     def mousePressEvent(self, event):
         """Handle mouse press event."""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -396,63 +623,35 @@ class ModernPresetCard(QWidget):
     
     def _get_preset_icon(self):
         """Get the appropriate icon for the preset."""
-        icon_map = {
-            'esports': '🏆',
-            'competitive': '⚔️',
-            'balanced': '⚖️',
-            'quality': '🎨',
-            'performance': '🚀'
-        }
-        return icon_map.get(self.preset_key, '⚙️')
+        return self._spec.icon
     
     def _get_preset_color(self):
         """Get the primary color for the preset."""
-        color_map = {
-            'esports': theme_manager.get_color('accent_gold'),
-            'competitive': theme_manager.get_color('accent_red'),
-            'balanced': theme_manager.get_color('accent_green'),
-            'quality': theme_manager.get_color('accent_blue'),
-            'performance': theme_manager.get_color('accent_purple')
-        }
-        return color_map.get(self.preset_key, theme_manager.get_color('primary'))
+        return theme_manager.get_color(self._spec.color_key)
     
     def _get_darker_color(self):
         """Get a darker version of the preset color."""
-        darker_map = {
-            'esports': '#b8860b',
-            'competitive': '#e74c3c',
-            'balanced': '#26a69a',
-            'quality': '#2980b9',
-            'performance': '#7fb069'
-        }
-        return darker_map.get(self.preset_key, theme_manager.get_color('primary_pressed'))
+        return self._spec.darker or theme_manager.get_color('primary_pressed')
     
     def _get_default_description(self):
         """Get default description for preset."""
-        desc_map = {
-            'esports': 'Maximum performance for competitive gaming',
-            'competitive': 'High performance with balanced settings',
-            'balanced': 'Optimal balance between quality and performance',
-            'quality': 'High visual quality with good performance',
-            'performance': 'Maximum performance with minimal quality loss'
-        }
-        return desc_map.get(self.preset_key, 'Optimized settings for better gaming')
+        return self._spec.description
     
     def _get_performance_value(self):
         """Get performance value for this preset."""
-        performance_map = {
-            'esports': 95,
-            'competitive': 85,
-            'balanced': 70,
-            'quality': 45,
-            'performance': 25
-        }
-        return performance_map.get(self.preset_key, 50)
+        return self._spec.performance
 
 
 class LoadingOverlay(QWidget):
     """Enhanced loading overlay with modern animations."""
     
+    BACKDROP_COLOR = QColor(0, 0, 0, 180)
+    SPINNER_SIZE = 48
+    SPINNER_FRAMES = 12  # One revolution per second
+    
+    # Pre-rendered spinner frames per (color, device pixel ratio)
+    _spinner_frame_cache = {}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
@@ -460,56 +659,98 @@ class LoadingOverlay(QWidget):
         
     def setup_ui(self):
         """Setup the loading overlay UI."""
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: rgba(0, 0, 0, 180);
-            }}
-        """)
+        # The backdrop is painted in paintEvent; keep ancestor styles from
+        # giving the labels opaque boxes on top of it. One sheet covers both
+        # labels, so the overlay costs a single stylesheet parse.
+        self.setStyleSheet("".join((
+            "QLabel { background: transparent; } QLabel#loadingText { font-size: ",
+            theme_manager.get_font('subheader_size'),
+            "; color: ",
+            theme_manager.get_color('text_primary'),
+            "; font-weight: bold; }",
+        )))
         
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Loading spinner
-        self.spinner = QLabel("⏳")
-        self.spinner.setStyleSheet(f"""
-            font-size: 48px;
-            color: {theme_manager.get_color('primary')};
-        """)
+        self.spinner = QLabel()
+        self._spinner_frames = self._get_spinner_frames(
+            theme_manager.get_color('primary'), self.devicePixelRatioF()
+        )
+        self.spinner.setPixmap(self._spinner_frames[0])
         self.spinner.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.spinner)
         
         # Loading text
         self.loading_text = QLabel("Loading...")
-        self.loading_text.setStyleSheet(f"""
-            font-size: {theme_manager.get_font('subheader_size')};
-            color: {theme_manager.get_color('text_primary')};
-            font-weight: bold;
-        """)
+        self.loading_text.setObjectName("loadingText")
         self.loading_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.loading_text)
         
         # Setup spinner animation
         self.setup_spinner_animation()
     
+    def paintEvent(self, event):
+        """Dim everything underneath the overlay."""
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self.BACKDROP_COLOR)
+    
+    @classmethod
+    def _get_spinner_frames(cls, color, dpr):
+        """Get the spinner rendered at each rotation step."""
+        frames = cls._spinner_frame_cache.get((color, dpr))
+        if frames is None:
+            size = cls.SPINNER_SIZE
+            pen = QPen(QColor(color), 5, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+            frames = []
+            for i in range(cls.SPINNER_FRAMES):
+                pixmap = QPixmap(round(size * dpr), round(size * dpr))
+                pixmap.setDevicePixelRatio(dpr)
+                pixmap.fill(Qt.GlobalColor.transparent)
+                painter = QPainter(pixmap)
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                painter.setPen(pen)
+                # Qt arc angles are counter-clockwise in 1/16 degree; step clockwise
+                start = (90 - i * 360 // cls.SPINNER_FRAMES) * 16
+                painter.drawArc(4, 4, size - 8, size - 8, start, 270 * 16)
+                painter.end()
+                frames.append(pixmap)
+            frames = cls._spinner_frame_cache[(color, dpr)] = tuple(frames)
+        return frames
+    
     def setup_spinner_animation(self):
         """Setup the spinner rotation animation."""
-        self.spinner_animation = QPropertyAnimation(self.spinner, b"rotation")
-        self.spinner_animation.setDuration(1000)
-        self.spinner_animation.setStartValue(0)
-        self.spinner_animation.setEndValue(360)
-        self.spinner_animation.setLoopCount(-1)  # Infinite loop
+        self._spinner_clock = QElapsedTimer()
+        self.spinner_animation = QTimer(self)
+        self.spinner_animation.setInterval(1000 // self.SPINNER_FRAMES)
+        self.spinner_animation.timeout.connect(self._advance_spinner)
+    
+    def _advance_spinner(self):
+        """Show the frame for the elapsed time, so late ticks don't slow the spin."""
+        frame = self._spinner_clock.elapsed() * self.SPINNER_FRAMES // 1000
+        self.spinner.setPixmap(self._spinner_frames[frame % self.SPINNER_FRAMES])
     
     def show_loading(self, text="Loading..."):
         """Show the loading overlay with custom text."""
         self.loading_text.setText(text)
         self.show()
-        self.spinner_animation.start()
         self.raise_()
     
     def hide_loading(self):
         """Hide the loading overlay."""
-        self.spinner_animation.stop()
         self.hide()
+    
+    def showEvent(self, event):
+        """Run the spinner only while the overlay is actually visible."""
+        super().showEvent(event)
+        self._spinner_clock.start()
+        self.spinner_animation.start()
+    
+    def hideEvent(self, event):
+        """Stop the spinner however the overlay got hidden, including via its parent."""
+        self.spinner_animation.stop()
+        super().hideEvent(event)
 
 
 # Backward compatibility
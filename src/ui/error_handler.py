@@ -10,27 +10,32 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QIcon, QPixmap
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from debug import log_info, log_error, log_warning
 from ui.theme import theme_manager
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Deque
+from collections import Counter, deque, namedtuple
+from itertools import islice
 import traceback
 import sys
+import time
+import atexit
+import queue
+import threading
 from datetime import datetime
+from enum import StrEnum
+from functools import lru_cache
+from html import escape
 
 
-class ErrorSeverity:
-    """Error severity levels."""
+class ErrorSeverity(StrEnum):
+    """Error severity levels. Members are strings, so plain values still match."""
     INFO = "info"
     WARNING = "warning"
     ERROR = "error"
     CRITICAL = "critical"
 
 
-class ErrorCategory:
+class ErrorCategory(StrEnum):
     """Error categories for better organization."""
     CONFIG = "configuration"
     FILE = "file_operation"
@@ -41,6 +46,12 @@ class ErrorCategory:
     PERMISSION = "permission"
 
 
+@lru_cache(maxsize=16)
+def _titled(name: str) -> str:
+    """Get a severity or category name in title case for display."""
+    return name.title()
+
+
 class FieldTunerError(Exception):
     """Base exception for FieldTuner with enhanced error information."""
     
@@ -54,33 +65,230 @@ class FieldTunerError(Exception):
         self.details = details or {}
         self.recovery_action = recovery_action
         self.timestamp = datetime.now()
-        self.traceback = traceback.format_exc()
+        # The exception being handled, if any, captured without its frames and
+        # only formatted when someone reads .traceback (the details view, the
+        # clipboard report)
+        exc_type, exc_value, exc_tb = sys.exc_info()
+        self._tb_exception: Optional[traceback.TracebackException] = (
+            traceback.TracebackException(exc_type, exc_value, exc_tb, lookup_lines=False)
+            if exc_type is not None else None
+        )
+        self._traceback: Optional[str] = None
+    
+    @property
+    def traceback(self) -> str:
+        """The traceback of the exception being handled when this error was created."""
+        if self._traceback is None:
+            tb_exception = self._tb_exception
+            self._traceback = ("".join(tb_exception.format()) if tb_exception is not None
+                               else "NoneType: None\n")
+        return self._traceback
+
+
+# Theme values used by ErrorDialog, read once per dialog. The *_px fields are
+# the spacings as ints, for layout calls that take pixels.
+_ThemeSnapshot = namedtuple("_ThemeSnapshot", (
+    "bg_primary bg_secondary bg_tertiary text_primary text_secondary text_tertiary "
+    "border_primary info spacing_sm spacing_md spacing_lg spacing_sm_px spacing_md_px "
+    "spacing_lg_px radius_sm radius_md font_primary font_secondary font_small "
+    "font_subheader font_mono"
+))
+
+
+def _theme_snapshot() -> _ThemeSnapshot:
+    """Read the ErrorDialog theme values from the current theme."""
+    spacing = {name: theme_manager.get_spacing(name) for name in ('sm', 'md', 'lg')}
+    return _ThemeSnapshot(
+        bg_primary=theme_manager.get_color('bg_primary'),
+        bg_secondary=theme_manager.get_color('bg_secondary'),
+        bg_tertiary=theme_manager.get_color('bg_tertiary'),
+        text_primary=theme_manager.get_color('text_primary'),
+        text_secondary=theme_manager.get_color('text_secondary'),
+        text_tertiary=theme_manager.get_color('text_tertiary'),
+        border_primary=theme_manager.get_color('border_primary'),
+        info=theme_manager.get_color('info'),
+        spacing_sm=spacing['sm'],
+        spacing_md=spacing['md'],
+        spacing_lg=spacing['lg'],
+        spacing_sm_px=int(spacing['sm'].rstrip('px')),
+        spacing_md_px=int(spacing['md'].rstrip('px')),
+        spacing_lg_px=int(spacing['lg'].rstrip('px')),
+        radius_sm=theme_manager.get_border_radius('sm'),
+        radius_md=theme_manager.get_border_radius('md'),
+        font_primary=theme_manager.get_font('primary_size'),
+        font_secondary=theme_manager.get_font('secondary_size'),
+        font_small=theme_manager.get_font('small_size'),
+        font_subheader=theme_manager.get_font('subheader_size'),
+        font_mono=theme_manager.get_font('monospace'),
+    )
+
+
+# Report copied by ErrorDialog's "Copy Error Details" button
+_CLIPBOARD_TEMPLATE = (
+    "FieldTuner Error Report\n"
+    "======================\n"
+    "\n"
+    "Severity: {severity}\n"
+    "Category: {category}\n"
+    "Message: {message}\n"
+    "Timestamp: {timestamp}\n"
+    "\n"
+    "Details:\n"
+    "{details}\n"
+    "\n"
+    "Traceback:\n"
+    "{traceback}"
+)
+
+
+# Finished ErrorDialog stylesheets per severity color. Dialogs for the same
+# severity reuse the same strings; the cache is dropped when the theme changes.
+_dialog_style_cache = {}
+
+
+def _dialog_styles(severity_color: str) -> Dict[str, str]:
+    """Get the ErrorDialog stylesheets for a dialog drawn in the given severity color."""
+    styles = _dialog_style_cache.get(severity_color)
+    if styles is None:
+        t = _theme_snapshot()
+        styles = _dialog_style_cache[severity_color] = {
+            'dialog': f"""
+                QDialog {{
+                    background-color: {t.bg_primary};
+                    color: {t.text_primary};
+                }}
+            """,
+            'header': f"""
+                QFrame {{
+                    background-color: {severity_color};
+                    border-radius: {t.radius_md};
+                    padding: {t.spacing_md};
+                }}
+            """,
+            'icon': f"""
+                font-size: 32px;
+                color: {t.text_primary};
+            """,
+            'title': f"""
+                font-size: {t.font_subheader};
+                font-weight: bold;
+                color: {t.text_primary};
+            """,
+            'category': f"""
+                font-size: {t.font_secondary};
+                color: {t.text_secondary};
+            """,
+            'message': f"""
+                font-size: {t.font_primary};
+                color: {t.text_primary};
+                padding: {t.spacing_md};
+                background-color: {t.bg_secondary};
+                border-radius: {t.radius_md};
+                border-left: 4px solid {severity_color};
+            """,
+            'details_toggle': f"""
+                QCheckBox {{
+                    font-size: {t.font_secondary};
+                    color: {t.text_secondary};
+                }}
+                QCheckBox::indicator {{
+                    width: 16px;
+                    height: 16px;
+                }}
+            """,
+            'details': f"""
+                font-size: {t.font_small};
+                color: {t.text_tertiary};
+                font-family: {t.font_mono};
+                background-color: {t.bg_tertiary};
+                padding: {t.spacing_sm};
+                border-radius: {t.radius_sm};
+            """,
+            'traceback': f"""
+                QTextEdit {{
+                    background-color: {t.bg_tertiary};
+                    color: {t.text_tertiary};
+                    border: 1px solid {t.border_primary};
+                    border-radius: {t.radius_sm};
+                    font-family: {t.font_mono};
+                    font-size: {t.font_small};
+                }}
+            """,
+            'recovery': f"""
+                QFrame {{
+                    background-color: {t.bg_secondary};
+                    border: 1px solid {t.border_primary};
+                    border-radius: {t.radius_md};
+                    padding: {t.spacing_md};
+                }}
+            """,
+            'recovery_title': f"""
+                font-size: {t.font_secondary};
+                font-weight: bold;
+                color: {t.info};
+            """,
+            'recovery_text': f"""
+                font-size: {t.font_primary};
+                color: {t.text_primary};
+            """,
+        }
+    return styles
+
+
+def _clear_theme_caches(_theme):
+    """Drop every stylesheet built from the previous theme."""
+    _dialog_style_cache.clear()
+
+
+theme_manager.theme_changed.connect(_clear_theme_caches)
 
 
 class ErrorDialog(QDialog):
-    """Enhanced error dialog with detailed information and recovery options."""
+    """
+    Enhanced error dialog with detailed information and recovery options.
+    
+    The widgets are built once; populate() fills them in for an error, so
+    one dialog can be shown again for the next error.
+    """
+    
+    # Theme color name per severity
+    _SEVERITY_COLORS = {
+        ErrorSeverity.INFO: 'info',
+        ErrorSeverity.WARNING: 'warning',
+        ErrorSeverity.ERROR: 'error',
+        ErrorSeverity.CRITICAL: 'error'
+    }
+    
+    _SEVERITY_ICONS = {
+        ErrorSeverity.INFO: "ℹ️",
+        ErrorSeverity.WARNING: "⚠️",
+        ErrorSeverity.ERROR: "❌",
+        ErrorSeverity.CRITICAL: "🚨"
+    }
     
     def __init__(self, error: FieldTunerError, parent=None):
         super().__init__(parent)
         self.error = error
+        self._styles = None
+        # Dialog size with the details collapsed / expanded, for the current error
+        self._collapsed_size = None
+        self._expanded_size = None
         self.setup_ui()
         self.setup_connections()
+        self.populate(error)
         
     def setup_ui(self):
         """Setup the error dialog UI."""
-        self.setWindowTitle(f"FieldTuner Error - {self.error.category.title()}")
         self.setModal(True)
         self.setMinimumSize(500, 400)
         
+        # Theme values shared by the create_* helpers
+        self._theme = t = _theme_snapshot()
+        
         # Main layout
         layout = QVBoxLayout(self)
-        layout.setSpacing(theme_manager.get_spacing('md'))
-        layout.setContentsMargins(
-            int(theme_manager.get_spacing('lg').replace('px', '')),
-            int(theme_manager.get_spacing('lg').replace('px', '')),
-            int(theme_manager.get_spacing('lg').replace('px', '')),
-            int(theme_manager.get_spacing('lg').replace('px', ''))
-        )
+        layout.setSpacing(t.spacing_md_px)
+        layout.setContentsMargins(t.spacing_lg_px, t.spacing_lg_px, t.spacing_lg_px, t.spacing_lg_px)
         
         # Header
         self.create_header(layout)
@@ -91,178 +299,117 @@ class ErrorDialog(QDialog):
         # Details section (collapsible)
         self.create_details_section(layout)
         
-        # Recovery section
-        if self.error.recovery_action:
-            self.create_recovery_section(layout)
+        # Recovery section, shown for errors with a recovery action
+        self.create_recovery_section(layout)
         
         # Action buttons
         self.create_action_buttons(layout)
-        
-        # Apply theme
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {theme_manager.get_color('bg_primary')};
-                color: {theme_manager.get_color('text_primary')};
-            }}
-        """)
     
     def create_header(self, layout):
         """Create the error dialog header."""
-        header_frame = QFrame()
-        header_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {self._get_severity_color()};
-                border-radius: {theme_manager.get_border_radius('md')};
-                padding: {theme_manager.get_spacing('md')};
-            }}
-        """)
-        
-        header_layout = QHBoxLayout(header_frame)
-        header_layout.setSpacing(theme_manager.get_spacing('md'))
+        t = self._theme
+        self.header_frame = QFrame()
+        
+        header_layout = QHBoxLayout(self.header_frame)
+        header_layout.setSpacing(t.spacing_md_px)
         
         # Error icon
-        icon_label = QLabel(self._get_severity_icon())
-        icon_label.setStyleSheet(f"""
-            font-size: 32px;
-            color: {theme_manager.get_color('text_primary')};
-        """)
-        header_layout.addWidget(icon_label)
+        self.icon_label = QLabel()
+        header_layout.addWidget(self.icon_label)
         
         # Error info
         info_layout = QVBoxLayout()
         info_layout.setSpacing(4)
         
-        title_label = QLabel(f"{self.error.severity.title()} Error")
-        title_label.setStyleSheet(f"""
-            font-size: {theme_manager.get_font('subheader_size')};
-            font-weight: bold;
-            color: {theme_manager.get_color('text_primary')};
-        """)
-        info_layout.addWidget(title_label)
-        
-        category_label = QLabel(f"Category: {self.error.category.title()}")
-        category_label.setStyleSheet(f"""
-            font-size: {theme_manager.get_font('secondary_size')};
-            color: {theme_manager.get_color('text_secondary')};
-        """)
-        info_layout.addWidget(category_label)
+        self.title_label = QLabel()
+        info_layout.addWidget(self.title_label)
+        
+        self.category_label = QLabel()
+        info_layout.addWidget(self.category_label)
         
         header_layout.addLayout(info_layout)
         header_layout.addStretch()
         
-        layout.addWidget(header_frame)
+        layout.addWidget(self.header_frame)
     
     def create_message_section(self, layout):
         """Create the error message section."""
-        message_label = QLabel(self.error.message)
-        message_label.setStyleSheet(f"""
-            font-size: {theme_manager.get_font('primary_size')};
-            color: {theme_manager.get_color('text_primary')};
-            padding: {theme_manager.get_spacing('md')};
-            background-color: {theme_manager.get_color('bg_secondary')};
-            border-radius: {theme_manager.get_border_radius('md')};
-            border-left: 4px solid {self._get_severity_color()};
-        """)
-        message_label.setWordWrap(True)
-        layout.addWidget(message_label)
+        self.message_label = QLabel()
+        self.message_label.setWordWrap(True)
+        layout.addWidget(self.message_label)
     
     def create_details_section(self, layout):
         """Create the collapsible details section."""
+        t = self._theme
         # Details toggle
         self.details_toggle = QCheckBox("Show Technical Details")
-        self.details_toggle.setStyleSheet(f"""
-            QCheckBox {{
-                font-size: {theme_manager.get_font('secondary_size')};
-                color: {theme_manager.get_color('text_secondary')};
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-            }}
-        """)
         self.details_toggle.toggled.connect(self.toggle_details)
         layout.addWidget(self.details_toggle)
         
-        # Details container
+        # Details container; its contents are built the first time it opens
         self.details_container = QWidget()
         self.details_container.hide()
         details_layout = QVBoxLayout(self.details_container)
-        details_layout.setSpacing(theme_manager.get_spacing('sm'))
+        details_layout.setSpacing(t.spacing_sm_px)
+        self.details_label = None
+        self.traceback_text = None
+        self._details_error = None  # Error the details widgets currently show
         
-        # Error details
-        if self.error.details:
-            details_text = "Error Details:\n"
-            for key, value in self.error.details.items():
-                details_text += f"• {key}: {value}\n"
-            
-            details_label = QLabel(details_text)
-            details_label.setStyleSheet(f"""
-                font-size: {theme_manager.get_font('small_size')};
-                color: {theme_manager.get_color('text_tertiary')};
-                font-family: {theme_manager.get_font('monospace')};
-                background-color: {theme_manager.get_color('bg_tertiary')};
-                padding: {theme_manager.get_spacing('sm')};
-                border-radius: {theme_manager.get_border_radius('sm')};
-            """)
-            details_label.setWordWrap(True)
-            details_layout.addWidget(details_label)
+        layout.addWidget(self.details_container)
+    
+    def _build_details(self):
+        """Create the details label and traceback view inside the details container."""
+        details_layout = self.details_container.layout()
         
-        # Traceback
-        traceback_text = QTextEdit()
-        traceback_text.setPlainText(self.error.traceback)
-        traceback_text.setReadOnly(True)
-        traceback_text.setMaximumHeight(150)
-        traceback_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {theme_manager.get_color('bg_tertiary')};
-                color: {theme_manager.get_color('text_tertiary')};
-                border: 1px solid {theme_manager.get_color('border_primary')};
-                border-radius: {theme_manager.get_border_radius('sm')};
-                font-family: {theme_manager.get_font('monospace')};
-                font-size: {theme_manager.get_font('small_size')};
-            }}
-        """)
-        details_layout.addWidget(traceback_text)
+        # Error details, shown for errors that carry any
+        self.details_label = QLabel()
+        self.details_label.setTextFormat(Qt.TextFormat.RichText)
+        self.details_label.setWordWrap(True)
+        self.details_label.setStyleSheet(self._styles['details'])
+        details_layout.addWidget(self.details_label)
         
-        layout.addWidget(self.details_container)
+        # Traceback
+        self.traceback_text = QTextEdit()
+        self.traceback_text.setReadOnly(True)
+        self.traceback_text.setMaximumHeight(150)
+        self.traceback_text.setStyleSheet(self._styles['traceback'])
+        details_layout.addWidget(self.traceback_text)
+    
+    def _show_details(self):
+        """Fill the details section for the current error, building it on first use."""
+        if self.traceback_text is None:
+            self._build_details()
+        if self._details_error is self.error:
+            return
+        error = self._details_error = self.error
+        if error.details:
+            self.details_label.setText("Error Details:<ul>" + "".join(
+                f"<li><b>{escape(str(key))}</b>: {escape(str(value))}</li>"
+                for key, value in error.details.items()) + "</ul>")
+        self.details_label.setVisible(bool(error.details))
+        self.traceback_text.setPlainText(error.traceback)
     
     def create_recovery_section(self, layout):
         """Create the recovery section."""
-        recovery_frame = QFrame()
-        recovery_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {theme_manager.get_color('bg_secondary')};
-                border: 1px solid {theme_manager.get_color('border_primary')};
-                border-radius: {theme_manager.get_border_radius('md')};
-                padding: {theme_manager.get_spacing('md')};
-            }}
-        """)
-        
-        recovery_layout = QVBoxLayout(recovery_frame)
-        recovery_layout.setSpacing(theme_manager.get_spacing('sm'))
-        
-        recovery_title = QLabel("💡 Recovery Suggestion")
-        recovery_title.setStyleSheet(f"""
-            font-size: {theme_manager.get_font('secondary_size')};
-            font-weight: bold;
-            color: {theme_manager.get_color('info')};
-        """)
-        recovery_layout.addWidget(recovery_title)
-        
-        recovery_text = QLabel(self.error.recovery_action)
-        recovery_text.setStyleSheet(f"""
-            font-size: {theme_manager.get_font('primary_size')};
-            color: {theme_manager.get_color('text_primary')};
-        """)
-        recovery_text.setWordWrap(True)
-        recovery_layout.addWidget(recovery_text)
-        
-        layout.addWidget(recovery_frame)
+        t = self._theme
+        self.recovery_frame = QFrame()
+        
+        recovery_layout = QVBoxLayout(self.recovery_frame)
+        recovery_layout.setSpacing(t.spacing_sm_px)
+        
+        self.recovery_title = QLabel("💡 Recovery Suggestion")
+        recovery_layout.addWidget(self.recovery_title)
+        
+        self.recovery_text = QLabel()
+        self.recovery_text.setWordWrap(True)
+        recovery_layout.addWidget(self.recovery_text)
+        
+        layout.addWidget(self.recovery_frame)
     
     def create_action_buttons(self, layout):
         """Create the action buttons."""
         button_layout = QHBoxLayout()
-        button_layout.setSpacing(theme_manager.get_spacing('md'))
+        button_layout.setSpacing(self._theme.spacing_md_px)
         
         # Copy error button
         copy_btn = QPushButton("📋 Copy Error Details")
@@ -273,11 +420,10 @@ class ErrorDialog(QDialog):
         button_layout.addStretch()
         
         # Report button (for critical errors)
-        if self.error.severity == ErrorSeverity.CRITICAL:
-            report_btn = QPushButton("🐛 Report Bug")
-            report_btn.setStyleSheet(theme_manager.get_button_style("warning", "sm"))
-            report_btn.clicked.connect(self.report_bug)
-            button_layout.addWidget(report_btn)
+        self.report_btn = QPushButton("🐛 Report Bug")
+        self.report_btn.setStyleSheet(theme_manager.get_button_style("warning", "sm"))
+        self.report_btn.clicked.connect(self.report_bug)
+        button_layout.addWidget(self.report_btn)
         
         # OK button
         ok_btn = QPushButton("OK")
@@ -288,32 +434,83 @@ class ErrorDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def populate(self, error: FieldTunerError):
+        """Show the given error in the dialog."""
+        self.error = error
+        self.setWindowTitle(f"FieldTuner Error - {_titled(error.category)}")
+        
+        # Restyle only when the severity color or the theme changed
+        styles = _dialog_styles(self._get_severity_color())
+        if styles is not self._styles:
+            self._apply_styles(styles)
+        
+        self.icon_label.setText(self._get_severity_icon())
+        self.title_label.setText(f"{_titled(error.severity)} Error")
+        self.category_label.setText(f"Category: {_titled(error.category)}")
+        self.message_label.setText(error.message)
+        
+        # Recovery section
+        self.recovery_text.setText(error.recovery_action or "")
+        self.recovery_frame.setVisible(bool(error.recovery_action))
+        
+        self.report_btn.setVisible(error.severity == ErrorSeverity.CRITICAL)
+        
+        # Start every error with the details collapsed, sized for its content
+        self._collapsed_size = self._expanded_size = None
+        self.details_toggle.setChecked(False)
+        if self._collapsed_size is None:
+            self.adjustSize()
+            self._collapsed_size = self.size()
+    
+    def _apply_styles(self, styles):
+        """Apply a set of stylesheets from _dialog_styles() to the dialog's widgets."""
+        self._styles = styles
+        self.setStyleSheet(styles['dialog'])
+        self.header_frame.setStyleSheet(styles['header'])
+        self.icon_label.setStyleSheet(styles['icon'])
+        self.title_label.setStyleSheet(styles['title'])
+        self.category_label.setStyleSheet(styles['category'])
+        self.message_label.setStyleSheet(styles['message'])
+        self.details_toggle.setStyleSheet(styles['details_toggle'])
+        if self.traceback_text is not None:
+            self.details_label.setStyleSheet(styles['details'])
+            self.traceback_text.setStyleSheet(styles['traceback'])
+        self.recovery_frame.setStyleSheet(styles['recovery'])
+        self.recovery_title.setStyleSheet(styles['recovery_title'])
+        self.recovery_text.setStyleSheet(styles['recovery_text'])
+    
     def setup_connections(self):
         """Setup signal connections."""
         pass
     
     def toggle_details(self, checked):
         """Toggle the details section visibility."""
+        if checked:
+            self._show_details()
         self.details_container.setVisible(checked)
+        
+        # Lay out each state once per error, then just switch between the sizes
+        size = self._expanded_size if checked else self._collapsed_size
+        if size is not None:
+            self.resize(size)
+            return
         self.adjustSize()
+        if checked:
+            self._expanded_size = self.size()
+        else:
+            self._collapsed_size = self.size()
     
     def copy_error_details(self):
         """Copy error details to clipboard."""
-        details = f"""
-FieldTuner Error Report
-======================
-
-Severity: {self.error.severity.title()}
-Category: {self.error.category.title()}
-Message: {self.error.message}
-Timestamp: {self.error.timestamp}
-
-Details:
-{self.error.details}
-
-Traceback:
-{self.error.traceback}
-        """.strip()
+        error = self.error
+        details = _CLIPBOARD_TEMPLATE.format(
+            severity=_titled(error.severity),
+            category=_titled(error.category),
+            message=error.message,
+            timestamp=error.timestamp,
+            details=error.details,
+            traceback=error.traceback.rstrip()
+        )
         
         # Copy to clipboard
         from PyQt6.QtWidgets import QApplication
@@ -336,31 +533,50 @@ Traceback:
     
     def _get_severity_color(self):
         """Get the color for the error severity."""
-        color_map = {
-            ErrorSeverity.INFO: theme_manager.get_color('info'),
-            ErrorSeverity.WARNING: theme_manager.get_color('warning'),
-            ErrorSeverity.ERROR: theme_manager.get_color('error'),
-            ErrorSeverity.CRITICAL: theme_manager.get_color('error')
-        }
-        return color_map.get(self.error.severity, theme_manager.get_color('error'))
+        return theme_manager.get_color(self._SEVERITY_COLORS.get(self.error.severity, 'error'))
     
     def _get_severity_icon(self):
         """Get the icon for the error severity."""
-        icon_map = {
-            ErrorSeverity.INFO: "ℹ️",
-            ErrorSeverity.WARNING: "⚠️",
-            ErrorSeverity.ERROR: "❌",
-            ErrorSeverity.CRITICAL: "🚨"
-        }
-        return icon_map.get(self.error.severity, "❌")
+        return self._SEVERITY_ICONS.get(self.error.severity, "❌")
 
 
 class ErrorHandler:
     """Centralized error handling system."""
     
+    # Debug log function per severity, and whether it takes the exception
+    _LOG_DISPATCH = {
+        ErrorSeverity.INFO: (log_info, False),
+        ErrorSeverity.WARNING: (log_warning, False),
+        ErrorSeverity.ERROR: (log_error, True),
+        ErrorSeverity.CRITICAL: (log_error, True),
+    }
+    
+    # Severities that handle_error() logs without recording when no dialog is shown
+    _NOTICE_LOGS = {
+        ErrorSeverity.INFO: log_info,
+        ErrorSeverity.WARNING: log_warning,
+    }
+    
+    # Repeats of the last error arriving within this many seconds of its
+    # first occurrence are counted on it instead of being logged and shown again
+    REPEAT_WINDOW = 0.5
+    
     def __init__(self):
-        self.error_log: List[FieldTunerError] = []
         self.max_log_size = 100
+        # Oldest entries drop off the front once the log is full
+        self.error_log: Deque[FieldTunerError] = deque(maxlen=self.max_log_size)
+        # Counts over the entries currently in error_log, kept up to date on append
+        self._by_severity: Counter = Counter()
+        self._by_category: Counter = Counter()
+        self._dialog_cache: Optional[ErrorDialog] = None  # Reused for every error
+        # Debug log calls waiting for the log worker thread, started on first use
+        self._log_queue: Optional[queue.SimpleQueue] = None
+        self._log_thread: Optional[threading.Thread] = None
+        # (category, severity, message) of the last logged error, when it was
+        # logged, and how many repeats of it have been swallowed since
+        self._last_key: Optional[tuple] = None
+        self._last_time: float = 0.0
+        self._repeats = 0
     
     def handle_error(self, error: Exception, context: str = "", 
                     category: str = ErrorCategory.SYSTEM,
@@ -371,10 +587,36 @@ class ErrorHandler:
         """
         Handle an error with comprehensive logging and user feedback.
         
+        Plain exceptions handled as INFO or WARNING without a dialog are only
+        written to the debug log; they are not kept in error_log.
+        
         Returns:
             bool: True if error was handled successfully, False otherwise
         """
         try:
+            # Log-only notices need nothing but their log line
+            if (not show_dialog and severity in self._NOTICE_LOGS
+                    and not isinstance(error, FieldTunerError)):
+                message = f"[{category}] {error}"
+                if context:
+                    message += f" | ctx: {context}"
+                self._queue_log(self._NOTICE_LOGS[severity], (message, "ERROR_HANDLER"))
+                return True
+            
+            # Coalesce a storm of identical errors into the first one
+            if isinstance(error, FieldTunerError):
+                key = (error.category, error.severity, error.message)
+            else:
+                key = (category, severity, str(error))
+            now = time.monotonic()
+            if key == self._last_key and now - self._last_time < self.REPEAT_WINDOW and self.error_log:
+                last = self.error_log[-1]
+                last.details['repeat_count'] = last.details.get('repeat_count', 1) + 1
+                self._repeats += 1
+                return True
+            self._log_repeats()
+            self._last_key, self._last_time = key, now
+            
             # Convert to FieldTunerError if needed
             if not isinstance(error, FieldTunerError):
                 error = FieldTunerError(
@@ -400,32 +642,85 @@ class ErrorHandler:
             
         except Exception as e:
             # Fallback error handling
-            log_error(f"Failed to handle error: {str(e)}", "ERROR_HANDLER", e)
+            self._queue_log(log_error, (f"Failed to handle error: {str(e)}", "ERROR_HANDLER", e))
             return False
     
     def log_error(self, error: FieldTunerError):
         """Log the error to the internal log."""
+        if len(self.error_log) == self.error_log.maxlen:
+            # The append below evicts the oldest entry; take it out of the counts
+            self._uncount(self.error_log[0])
         self.error_log.append(error)
-        
-        # Maintain log size
-        if len(self.error_log) > self.max_log_size:
-            self.error_log.pop(0)
-        
-        # Log to debug system
-        if error.severity == ErrorSeverity.CRITICAL:
-            log_error(f"[{error.category}] {error.message}", "ERROR_HANDLER", error)
-        elif error.severity == ErrorSeverity.ERROR:
-            log_error(f"[{error.category}] {error.message}", "ERROR_HANDLER", error)
-        elif error.severity == ErrorSeverity.WARNING:
-            log_warning(f"[{error.category}] {error.message}", "ERROR_HANDLER")
-        else:
-            log_info(f"[{error.category}] {error.message}", "ERROR_HANDLER")
+        self._by_severity[error.severity] += 1
+        self._by_category[error.category] += 1
+        
+        # Log to debug system from the worker thread, so file writes never
+        # block the event loop; a single worker keeps the entries in order
+        log, with_exception = self._LOG_DISPATCH.get(error.severity, (log_info, False))
+        args = (f"[{error.category}] {error.message}", "ERROR_HANDLER")
+        if with_exception:
+            args += (error,)
+        self._queue_log(log, args)
+    
+    def _log_repeats(self):
+        """Log how often the last error repeated, once its burst is over."""
+        if not self._repeats:
+            return
+        category, severity, message = self._last_key
+        log = self._NOTICE_LOGS.get(severity, log_warning)
+        self._queue_log(log, (f"[{category}] {message} (repeated {self._repeats} more times)",
+                              "ERROR_HANDLER"))
+        self._repeats = 0
+    
+    def _queue_log(self, log, args):
+        """Hand a debug log call to the log worker thread."""
+        if self._log_queue is None:
+            self._start_log_worker()
+        self._log_queue.put((log, args))
+    
+    def _start_log_worker(self):
+        """Start the thread that makes the debug log calls queued by log_error."""
+        self._log_queue = queue.SimpleQueue()
+        self._log_thread = threading.Thread(
+            target=self._log_worker, name="ErrorHandlerLog", daemon=True)
+        self._log_thread.start()
+        atexit.register(self.flush_log)
+    
+    def _log_worker(self):
+        """Make queued debug log calls until flush_log() sends None."""
+        while True:
+            item = self._log_queue.get()
+            if item is None:
+                return
+            log, args = item
+            try:
+                log(*args)
+            except Exception as e:
+                print(f"Failed to log error: {e}")
+    
+    def flush_log(self, timeout: float = 2.0):
+        """Write out any queued log entries and stop the log worker thread."""
+        self._log_repeats()
+        if self._log_thread is None:
+            return
+        self._log_queue.put(None)
+        self._log_thread.join(timeout)
+        self._log_queue = self._log_thread = None
+        atexit.unregister(self.flush_log)
     
     def show_error_dialog(self, error: FieldTunerError):
         """Show the error dialog."""
         try:
-            dialog = ErrorDialog(error)
-            dialog.exec()
+            if self._dialog_cache is None:
+                self._dialog_cache = ErrorDialog(error)
+            elif self._dialog_cache.isVisible():
+                # Handled while the cached dialog is still open (e.g. from a
+                # timer during its modal loop): leave it alone and nest a new one
+                ErrorDialog(error).exec()
+                return
+            else:
+                self._dialog_cache.populate(error)
+            self._dialog_cache.exec()
         except Exception as e:
             # Fallback to simple message box
             QMessageBox.critical(
@@ -443,16 +738,11 @@ class ErrorHandler:
         
         summary = {
             "total": len(self.error_log),
-            "by_severity": {},
-            "by_category": {},
+            "by_severity": dict(self._by_severity),
+            "by_category": dict(self._by_category),
             "recent": []
         }
         
-        # Count by severity and category
-        for error in self.error_log:
-            summary["by_severity"][error.severity] = summary["by_severity"].get(error.severity, 0) + 1
-            summary["by_category"][error.category] = summary["by_category"].get(error.category, 0) + 1
-        
         # Recent errors (last 5)
         summary["recent"] = [
             {
@@ -461,7 +751,7 @@ class ErrorHandler:
                 "category": error.category,
                 "timestamp": error.timestamp
             }
-            for error in self.error_log[-5:]
+            for error in reversed(list(islice(reversed(self.error_log), 5)))
         ]
         
         return summary
@@ -469,7 +759,18 @@ class ErrorHandler:
     def clear_error_log(self):
         """Clear the error log."""
         self.error_log.clear()
-        log_info("Error log cleared", "ERROR_HANDLER")
+        self._by_severity.clear()
+        self._by_category.clear()
+        self._log_repeats()
+        self._last_key = None
+        self._queue_log(log_info, ("Error log cleared", "ERROR_HANDLER"))
+    
+    def _uncount(self, error: FieldTunerError):
+        """Remove an error leaving the log from the summary counts."""
+        for counts, key in ((self._by_severity, error.severity), (self._by_category, error.category)):
+            counts[key] -= 1
+            if not counts[key]:
+                del counts[key]
 
 
 # Global error handler instance
@@ -12,15 +12,6 @@ from PyQt6.QtGui import QFont, QCloseEvent
 
 from debug import log_info, log_error, log_warning
 from ui.components.custom_widgets import LoadingOverlay
-from ui.tabs.quick_settings_v2 import QuickSettingsTab
-from ui.tabs.bf6_features import BF6FeaturesTab
-from ui.tabs.graphics import GraphicsTab
-from ui.tabs.input import InputTab
-from ui.tabs.advanced import AdvancedTab
-from ui.tabs.backup import BackupTab
-from ui.tabs.code_view import CodeViewTab
-from ui.tabs.debug import DebugTab
-from ui.tabs.preferences import PreferencesTab
 from ui.theme import theme_manager
 
 
@@ -154,6 +145,17 @@ class MainWindow(QMainWindow):
     
     def setup_tabs(self):
         """Setup the tab widgets."""
+        # Tab modules are only needed here, so importing ui.main_window stays cheap
+        from ui.tabs.quick_settings_v2 import QuickSettingsTab
+        from ui.tabs.bf6_features import BF6FeaturesTab
+        from ui.tabs.graphics import GraphicsTab
+        from ui.tabs.input import InputTab
+        from ui.tabs.advanced import AdvancedTab
+        from ui.tabs.backup import BackupTab
+        from ui.tabs.code_view import CodeViewTab
+        from ui.tabs.debug import DebugTab
+        from ui.tabs.preferences import PreferencesTab
+        
         # Create all tabs
         self.quick_tab = QuickSettingsTab(self.config_manager, self.favorites_manager)
         self.bf6_features_tab = BF6FeaturesTab(self.config_manager)
@@ -1,22 +1,22 @@
 """
 FieldTuner V2.0 - UI Tabs
 Contains all tab components for the main interface.
+
+Tabs are imported lazily on first access.
 """
 
-from .quick_settings import QuickSettingsTab
-from .graphics import GraphicsTab
-from .input import InputTab
-from .advanced import AdvancedTab
-from .backup import BackupTab
-from .code_view import CodeViewTab
-from .debug import DebugTab
+from .. import _lazy_exports
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'QuickSettingsTab': '.quick_settings',
+    'GraphicsTab': '.graphics',
+    'InputTab': '.input',
+    'AdvancedTab': '.advanced',
+    'BackupTab': '.backup',
+    'CodeViewTab': '.code_view',
+    'DebugTab': '.debug',
+}
 
-__all__ = [
-    'QuickSettingsTab',
-    'GraphicsTab',
-    'InputTab',
-    'AdvancedTab',
-    'BackupTab',
-    'CodeViewTab',
-    'DebugTab'
-]
+__all__ = list(_LAZY)
+__getattr__, __dir__ = _lazy_exports(__name__, _LAZY)
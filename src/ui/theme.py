@@ -7,6 +7,7 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QColor, QPalette
 from PyQt6.QtWidgets import QApplication
 from typing import Dict, Any
+from functools import lru_cache
 import json
 from pathlib import Path
 
@@ -175,18 +176,22 @@ class ThemeManager(QObject):
             }
         }
     
+    @lru_cache(maxsize=256)
     def get_color(self, color_name: str) -> str:
         """Get a color value from the current theme."""
         return self.themes[self.current_theme]["colors"].get(color_name, "#000000")
     
+    @lru_cache(maxsize=256)
     def get_font(self, font_name: str) -> str:
         """Get a font value from the current theme."""
         return self.themes[self.current_theme]["fonts"].get(font_name, "14px")
     
+    @lru_cache(maxsize=256)
     def get_spacing(self, spacing_name: str) -> str:
         """Get a spacing value from the current theme."""
         return self.themes[self.current_theme]["spacing"].get(spacing_name, "8px")
     
+    @lru_cache(maxsize=256)
     def get_border_radius(self, radius_name: str) -> str:
         """Get a border radius value from the current theme."""
         return self.themes[self.current_theme]["border_radius"].get(radius_name, "4px")
@@ -203,12 +208,20 @@ class ThemeManager(QObject):
         """Set the current theme."""
         if theme_name in self.themes:
             self.current_theme = theme_name
+            self._clear_lookup_caches()
             self._apply_theme(theme_name)
             self.theme_changed.emit(theme_name)
             log_info(f"Theme changed to: {theme_name}", "THEME")
         else:
             log_error(f"Theme '{theme_name}' not found", "THEME")
     
+    @classmethod
+    def _clear_lookup_caches(cls):
+        """Drop the memoized lookups resolved from the previous theme."""
+        for lookup in (cls.get_color, cls.get_font, cls.get_spacing,
+                       cls.get_border_radius, cls.get_button_style):
+            lookup.cache_clear()
+    
     def _apply_theme(self, theme_name: str):
         """Apply theme to the application."""
         try:
@@ -244,6 +257,7 @@ class ThemeManager(QObject):
         """Get available themes with their descriptions."""
         return {name: theme["description"] for name, theme in self.themes.items()}
     
+    @lru_cache(maxsize=256)
     def get_button_style(self, variant: str = "primary", size: str = "md") -> str:
         """Get standardized button styles."""
         colors = self.themes[self.current_theme]["colors"]
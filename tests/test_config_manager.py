@@ -13,7 +13,10 @@ import os
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import core  # Must load before debug, which main imports
 from main import ConfigManager
+from core.config_manager import ConfigManager as CoreConfigManager
+from core.path_config import path_config
 
 
 class TestConfigManager:
@@ -101,6 +104,27 @@ class TestConfigManager:
         # Note: This is a basic test - real parsing would need actual BF6 config data
         assert hasattr(manager, 'settings')
     
+    def test_set_settings_bulk(self):
+        """Test setting several values in one call"""
+        with patch.object(ConfigManager, '_parse_config_data', return_value={}):
+            manager = ConfigManager(self.config_path)
+            
+            manager.set_settings_bulk({'GstRender.Dx12Enabled': 1, 'GstRender.FieldOfViewVertical': 90.0})
+            assert manager.get_setting('GstRender.Dx12Enabled') == '1'
+            assert manager.get_setting('GstRender.FieldOfViewVertical') == '90.0'
+    
+    def test_get_all_settings_returns_snapshot(self):
+        """Test that get_all_settings returns a copy of the current values"""
+        with patch.object(ConfigManager, '_parse_config_data', return_value={}):
+            manager = ConfigManager(self.config_path)
+            manager.set_setting('GstRender.Dx12Enabled', 1)
+            
+            snapshot = manager.get_all_settings()
+            assert snapshot['GstRender.Dx12Enabled'] == '1'
+            
+            snapshot['GstRender.Dx12Enabled'] = '0'
+            assert manager.get_setting('GstRender.Dx12Enabled') == '1'
+    
     def test_backup_directory_creation(self):
         """Test backup directory creation"""
         with patch.object(ConfigManager, '_parse_config_data', return_value={}):
@@ -178,3 +202,116 @@ class TestConfigManagerIntegration:
             # List backups
             backups = manager.list_backups()
             assert len(backups) == initial_count + 3
+
+
+class TestConfigCaches:
+    """Tests for the parse cache, remembered config path and process check TTL"""
+    
+    @pytest.fixture(autouse=True)
+    def isolated_app_data(self, tmp_path, monkeypatch):
+        """Point path_config's app data (and the paths cached from it) at tmp_path"""
+        monkeypatch.setattr(path_config, 'app_data_dir', tmp_path / "app_data")
+        for name in ('cache_dir', 'resolved_paths_file'):
+            monkeypatch.delitem(vars(path_config), name, raising=False)
+        monkeypatch.delenv('FIELDTUNER_CONFIG_PATH', raising=False)
+        
+        self.config_path = tmp_path / "PROFSAVE_profile"
+        self.config_path.write_bytes(b"PROFSAVE GstRender.Dx12Enabled 1\n" + b"\0" * 200)
+    
+    def _make_manager(self):
+        """Create a core ConfigManager for config_path without loading it"""
+        with patch.object(CoreConfigManager, '_load_config', return_value=True), \
+                patch.object(CoreConfigManager, '_is_battlefield_running', return_value=False):
+            return CoreConfigManager(self.config_path)
+    
+    def test_parse_cache_hit(self):
+        """Test that an unchanged config file is loaded from the parse cache"""
+        manager = self._make_manager()
+        manager.config_data = {'GstRender.Dx12Enabled': '1'}
+        manager._save_parse_cache()
+        
+        manager = self._make_manager()
+        assert manager._load_parse_cache() is True
+        assert manager.config_data == {'GstRender.Dx12Enabled': '1'}
+        assert manager.original_data == self.config_path.read_bytes()
+    
+    def test_parse_cache_miss_after_size_change(self):
+        """Test that the parse cache is ignored once the file size changes"""
+        manager = self._make_manager()
+        manager.config_data = {'GstRender.Dx12Enabled': '1'}
+        manager._save_parse_cache()
+        
+        self.config_path.write_bytes(self.config_path.read_bytes() + b"GstRender.Dx12Enabled 0\n")
+        assert self._make_manager()._load_parse_cache() is False
+    
+    def test_parse_cache_miss_after_mtime_change(self):
+        """Test that the parse cache is ignored once the file is touched"""
+        manager = self._make_manager()
+        manager.config_data = {'GstRender.Dx12Enabled': '1'}
+        manager._save_parse_cache()
+        
+        stat = self.config_path.stat()
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert self._make_manager()._load_parse_cache() is False
+    
+    def test_corrupt_parse_cache_falls_back_to_parsing(self):
+        """Test that an unreadable parse cache is replaced by a fresh parse"""
+        manager = self._make_manager()
+        cache_file = manager._parse_cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text("{not json", encoding='utf-8')
+        assert manager._load_parse_cache() is False
+        
+        def parse():
+            manager.config_data = {'GstRender.Dx12Enabled': '1'}
+            return True
+        
+        with patch.object(manager, '_load_binary_config', side_effect=parse) as load_binary:
+            assert manager._load_config() is True
+        load_binary.assert_called_once()
+        
+        # The fresh parse replaced the corrupt cache
+        assert self._make_manager()._load_parse_cache() is True
+    
+    def test_remembered_config_path(self):
+        """Test that a remembered config path is used on the next detection"""
+        path_config.remember_config_path(self.config_path)
+        assert path_config.get_cached_config_path() == self.config_path
+        
+        manager = self._make_manager()
+        manager.config_path = None
+        manager.CONFIG_PATHS = []
+        assert manager._detect_config_file() is True
+        assert manager.config_path == self.config_path
+    
+    def test_remembered_config_path_ignored_when_missing(self):
+        """Test that a remembered config path is skipped once the file is gone"""
+        path_config.remember_config_path(self.config_path)
+        manager = self._make_manager()
+        self.config_path.unlink()
+        
+        manager.config_path = None
+        manager.CONFIG_PATHS = []
+        assert manager._detect_config_file() is False
+        assert manager.config_path is None
+    
+    def test_remembered_config_path_ignored_with_override(self, monkeypatch):
+        """Test that FIELDTUNER_CONFIG_PATH wins over a remembered config path"""
+        path_config.remember_config_path(self.config_path)
+        monkeypatch.setenv('FIELDTUNER_CONFIG_PATH', str(self.config_path.parent / "override"))
+        
+        assert path_config.get_cached_config_path() is None
+    
+    def test_process_check_ttl(self):
+        """Test that the Battlefield process scan is reused until PROCESS_CHECK_TTL expires"""
+        manager = self._make_manager()
+        ttl = CoreConfigManager.PROCESS_CHECK_TTL
+        
+        with patch.object(manager, '_scan_for_battlefield', return_value=False) as scan, \
+                patch('core.config_manager.time.monotonic', side_effect=[0.0, ttl / 2, ttl + 0.1]):
+            assert manager._is_battlefield_running() is False
+            assert manager._is_battlefield_running() is False
+            assert scan.call_count == 1
+            
+            assert manager._is_battlefield_running() is False
+            assert scan.call_count == 2
@@ -0,0 +1,122 @@
+"""
+Tests for ErrorHandler class
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import core  # Must load before debug, which ui.error_handler imports
+from ui.error_handler import ErrorHandler, ErrorSeverity, ErrorCategory, FieldTunerError
+
+
+class TestErrorHandler:
+    """Test cases for ErrorHandler"""
+
+    def setup_method(self):
+        """Setup for each test method"""
+        self.handler = ErrorHandler()
+
+    def teardown_method(self):
+        """Cleanup after each test method"""
+        self.handler.flush_log()
+
+    def test_summary_after_log_is_full(self):
+        """Test summary totals once old errors are evicted from the log"""
+        categories = [ErrorCategory.CONFIG, ErrorCategory.FILE]
+        for i in range(150):
+            self.handler.handle_error(ValueError(f"error {i}"), category=categories[i % 2],
+                                      severity=ErrorSeverity.ERROR, show_dialog=False)
+
+        summary = self.handler.get_error_summary()
+        assert summary["total"] == self.handler.max_log_size == 100
+        assert summary["by_severity"] == {ErrorSeverity.ERROR: 100}
+        assert summary["by_category"] == {ErrorCategory.CONFIG: 50, ErrorCategory.FILE: 50}
+        assert [e["message"] for e in summary["recent"]] == [f"error {i}" for i in range(145, 150)]
+
+    def test_summary_drops_evicted_severities(self):
+        """Test that a severity no longer in the log leaves the summary"""
+        self.handler.handle_error(ValueError("critical"), severity=ErrorSeverity.CRITICAL,
+                                  show_dialog=False)
+        for i in range(self.handler.max_log_size):
+            self.handler.handle_error(ValueError(f"error {i}"), show_dialog=False)
+
+        summary = self.handler.get_error_summary()
+        assert ErrorSeverity.CRITICAL not in summary["by_severity"]
+        assert summary["by_severity"] == {ErrorSeverity.ERROR: 100}
+
+    def test_repeated_error_is_counted(self):
+        """Test that an identical error inside REPEAT_WINDOW is coalesced"""
+        with patch.object(ErrorHandler, 'REPEAT_WINDOW', 60.0):
+            self.handler.handle_error(ValueError("disk full"), show_dialog=False)
+            self.handler.handle_error(ValueError("disk full"), show_dialog=False)
+
+        assert len(self.handler.error_log) == 1
+        assert self.handler.error_log[-1].details['repeat_count'] == 2
+        assert self.handler.get_error_summary()["total"] == 1
+
+    def test_repeat_outside_window_is_logged(self):
+        """Test that a repeat after REPEAT_WINDOW starts a new entry"""
+        with patch.object(ErrorHandler, 'REPEAT_WINDOW', 0.0):
+            self.handler.handle_error(ValueError("disk full"), show_dialog=False)
+            self.handler.handle_error(ValueError("disk full"), show_dialog=False)
+
+        assert len(self.handler.error_log) == 2
+        assert 'repeat_count' not in self.handler.error_log[-1].details
+
+    def test_notices_are_not_counted(self):
+        """Test that INFO/WARNING errors without a dialog skip the error log"""
+        for severity in (ErrorSeverity.INFO, ErrorSeverity.WARNING):
+            assert self.handler.handle_error(ValueError("notice"), severity=severity,
+                                             show_dialog=False) is True
+
+        assert len(self.handler.error_log) == 0
+        assert self.handler.get_error_summary() == {"total": 0, "by_severity": {}, "by_category": {}}
+
+    def test_field_tuner_warning_is_counted(self):
+        """Test that a FieldTunerError warning is still recorded"""
+        error = FieldTunerError("low disk space", severity=ErrorSeverity.WARNING)
+        self.handler.handle_error(error, show_dialog=False)
+
+        assert list(self.handler.error_log) == [error]
+
+    def test_flush_log(self):
+        """Test that flush_log writes queued entries and stops the worker"""
+        log = Mock()
+        with patch.dict(ErrorHandler._LOG_DISPATCH, {ErrorSeverity.ERROR: (log, False)}):
+            self.handler.handle_error(ValueError("queued"), category=ErrorCategory.FILE,
+                                      show_dialog=False)
+            self.handler.flush_log()
+
+        log.assert_called_once_with(f"[{ErrorCategory.FILE}] queued", "ERROR_HANDLER")
+        assert self.handler._log_thread is None
+
+        # Flushing again is a no-op, and logging afterwards restarts the worker
+        self.handler.flush_log()
+        self.handler.handle_error(ValueError("later"), show_dialog=False)
+        assert self.handler._log_thread is not None
+
+    def test_flush_log_reports_repeats(self):
+        """Test that flush_log logs how often the last error repeated"""
+        with patch('ui.error_handler.log_warning') as log_warning, \
+                patch.object(ErrorHandler, 'REPEAT_WINDOW', 60.0):
+            for _ in range(3):
+                self.handler.handle_error(ValueError("disk full"), show_dialog=False)
+            self.handler.flush_log()
+
+        log_warning.assert_called_once_with(
+            f"[{ErrorCategory.SYSTEM}] disk full (repeated 2 more times)", "ERROR_HANDLER")
+
+    def test_clear_error_log(self):
+        """Test clearing the log resets the summary"""
+        self.handler.handle_error(ValueError("error"), show_dialog=False)
+        self.handler.clear_error_log()
+
+        assert self.handler.get_error_summary()["total"] == 0
+        # The same error is no longer treated as a repeat
+        self.handler.handle_error(ValueError("error"), show_dialog=False)
+        assert len(self.handler.error_log) == 1